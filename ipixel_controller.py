@@ -8,14 +8,45 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, colorchooser
 import asyncio
 import threading
+import queue
 from PIL import Image, ImageTk, ImageDraw, ImageFont
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 import urllib.parse
 import os
 import sys
 import tempfile
 import math
 import json
+import time
+import base64
+import functools
+import hashlib
+import stat
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     from pypixelcolor import Client
@@ -25,7 +56,190 @@ except ImportError:
     sys.exit(1)
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_temp_image(temp_int, folder):
+    """Return the first existing temperature image for temp_int in folder."""
+    candidates = []
+    if temp_int < 0:
+        candidates.append(f"temp_minus_{abs(temp_int)}.png")
+        candidates.append(f"temp_-{abs(temp_int)}.png")
+    else:
+        candidates.append(f"temp_plus_{temp_int}.png")
+        candidates.append(f"temp_{temp_int}.png")
+        if temp_int == 0:
+            candidates.append("temp_0.png")
+            candidates.append("temp_plus_0.png")
+    for name in candidates:
+        path = os.path.join(folder, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_asset(path_value):
+    """Resolve a user or app-relative asset path; pure string work, so memoized."""
+    if not path_value:
+        return ""
+    path_value = os.path.expanduser(path_value)
+    if os.path.isabs(path_value):
+        return path_value
+    return os.path.normpath(os.path.join(os.path.dirname(__file__), path_value))
+
+
+@functools.lru_cache(maxsize=32)
+def _temp_path(name):
+    """Path for a scratch file in the system temp dir."""
+    return os.path.join(tempfile.gettempdir(), name)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_sprite_sheet(path, mtime):
+    """Decode a sprite sheet once per (path, mtime) in its native mode; callers must not mutate it."""
+    with Image.open(path) as sheet:
+        sheet.load()
+        return sheet.copy()
+
+
+@functools.lru_cache(maxsize=1)
+def _preview_font():
+    """Font for preset text previews, loaded once."""
+    try:
+        return ImageFont.truetype("arial.ttf", 8)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=1)
+def _youtube_font():
+    """Font for the inline YouTube subscriber count, loaded once."""
+    try:
+        return ImageFont.truetype("arial.ttf", 10)
+    except Exception:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=1)
+def _preview_font_id():
+    """Identity of the preview font (family, style, size), for preview cache keys."""
+    font = _preview_font()
+    name = font.getname() if hasattr(font, 'getname') else (type(font).__name__,)
+    return (*name, getattr(font, 'size', None))
+
+
+@functools.lru_cache(maxsize=512)
+def _preview_text_advance(text):
+    """Advance width of text in the preset preview font, for summing word widths."""
+    return _preview_font().getlength(text)
+
+
+def _load_png(path):
+    """Open and fully decode an image file; safe to run off the Tk thread."""
+    img = Image.open(path)
+    img.load()
+    return img
+
+
+def _json_dumps(obj):
+    """Serialize obj as indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _json_load(path):
+    """Parse a JSON file, using orjson when available."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _atomic_write(path, data):
+    """Write bytes to a sibling temp file and swap it in, so readers never see a partial file."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _gol_step(state, out):
+        """Single-pass Game of Life step on a wrapping uint8 grid."""
+        H, W = state.shape
+        for y in range(H):
+            yu = (y - 1) % H
+            yd = (y + 1) % H
+            for x in range(W):
+                xl = (x - 1) % W
+                xr = (x + 1) % W
+                n = (state[yu, xl] + state[yu, x] + state[yu, xr] +
+                     state[y, xl] + state[y, xr] +
+                     state[yd, xl] + state[yd, x] + state[yd, xr])
+                out[y, x] = 1 if n == 3 or (n == 2 and state[y, x]) else 0
+
+    @njit(cache=True, boundscheck=False)
+    def _blend_sprite_tiles(stacked, indices, bg, out):
+        """Gather sprite tiles by index and alpha-blend them over a flat background in one pass."""
+        tile_h = stacked.shape[1]
+        tile_w = stacked.shape[2]
+        nch = out.shape[2]
+        for k in range(indices.shape[0]):
+            tile = stacked[indices[k]]
+            x0 = k * tile_w
+            for y in range(tile_h):
+                for x in range(tile_w):
+                    a = int(tile[y, x, 3])
+                    for c in range(nch):
+                        # Same rounding as PIL's paste with a mask
+                        v = int(bg[c]) * (255 - a) + int(tile[y, x, c]) * a + 128
+                        out[y, x0 + x, c] = ((v >> 8) + v) >> 8
+else:
+    _gol_step = None
+    _blend_sprite_tiles = None
+
+
 class iPixelController:
+    # Live countdown text per format, called as (days, hours, minutes, event_name)
+    _COUNTDOWN_FORMATTERS = {
+        "days_hours_mins": lambda d, h, m, e: f"{d}d {h}h {m}m",
+        "days_hours": lambda d, h, m, e: f"{d}d {h}h",
+        "hours_mins": lambda d, h, m, e: f"{d * 24 + h}h {m}m",
+        "days_only": lambda d, h, m, e: f"{d} days",
+        "with_name": lambda d, h, m, e: f"{e}: {d}d {h}h {m}m",
+    }
+    # Seconds between changes of the countdown text per format
+    _COUNTDOWN_STEPS = {
+        "days_only": 86400,
+        "days_hours": 3600,
+        "hours_mins": 60,
+        "days_hours_mins": 60,
+        "with_name": 60,
+    }
+    # Bump when text preview rendering changes so cached preview files are redrawn
+    _TEXT_PREVIEW_VERSION = 2
+    # Icons shown next to each preset type in the presets list
+    _PRESET_TYPE_ICONS = {"text": "📝", "image": "🖼️", "clock": "🕐", "stock": "📈", "youtube": "📺", "weather": "🌤️", "animation": "🎨"}
+    # Clock/countdown animation names to device animation codes
+    _ANIMATION_CODES = {
+        "static": 0,
+        "scroll_left": 1,
+        "flash": 4
+    }
+    # Static countdown frame cycles per format, called as (days, hours, minutes, event_name)
+    _COUNTDOWN_FRAME_BUILDERS = {
+        "with_name": lambda d, h, m, e: [e.strip() or "Event", f"{d}d", f"{h}h {m}m"],
+        "days_hours_mins": lambda d, h, m, e: [f"{d}d", f"{h}h {m}m"],
+        "days_hours": lambda d, h, m, e: [f"{d}d", f"{h}h"],
+        "hours_mins": lambda d, h, m, e: [f"{d * 24 + h}h", f"{m}m"],
+        "days_only": lambda d, h, m, e: [f"{d} days"],
+    }
+
     def __init__(self, root):
         self.root = root
         self.root.title("iPixel LED Panel Controller")
@@ -36,13 +250,57 @@ class iPixelController:
         self.device_address = None
         self.is_connected = False
         self.loop = None
+        self._loop_ready = threading.Event()  # Set once the event loop is running
+        self._aio_session = None
+        self._ble_queue = None
+        self._ui_queue = queue.Queue()  # (fn, args, kwargs) waiting to run on the Tk thread
+        self._ui_lock = threading.Lock()
+        self._ui_pump_pending = False
+        self._client_accepts_buffers = None  # Unknown until the first in-memory send
+        self._sprite_layouts = {}  # (path, order, cols, size) -> (tile_w, tile_h, glyph boxes)
+        self._sprite_font_index = {}  # name -> sprite font dict from settings['sprite_fonts']
+        self._countdown_sprite_font = (None, None)  # (selected name, font) for countdown ticks
+        self._sprite_glyph_cache = {}  # (path, order, cols) -> (mtime, glyph dict, blank, tile stack, byte index)
+        self._sprite_stat_cache = {}  # resolved path -> (checked at, mtime or None)
+        self._sprite_font_errors = {}  # (path, mtime, order, cols) -> load error or None
+        self._pad_buffer_cache = OrderedDict()  # (mode, w, h, bg, x) -> padded scroll line
+        self._countdown_sprite_cache = OrderedDict()  # (text, path, order, cols, bg) -> PNG bytes
+        self._sprite_line_cache = OrderedDict()  # (path, mtime, order, cols, bg, text) -> line image
+        # Sprite caches are used from the Tk thread and the BLE worker; this guards
+        # the caches above (renders happen outside it)
+        self._sprite_cache_lock = threading.Lock()
+        
+        # Shared HTTP session so Graph API polls reuse keep-alive connections
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4))
+        self.graph_http = self._create_graph_client()
+        self._anim_buf = None  # Reusable RGB buffer for animation frames
+        self._plasma_x = None
+        self._plasma_y = None
+        self._plasma_palette = None
         
         # Initialize presets
         self.presets_file = "ipixel_presets.json"
         self.settings_file = "ipixel_settings.json"
         self.secrets_file = "ipixel_secrets.json"
+        self.thumbnails_dir = "ipixel_thumbs"
         self.presets = []
+        self._preset_by_name = {}
+        self._preset_latest = None
+        self._preset_event = threading.Event()
+        self._current_preset_name = None  # Preset currently on the panel, None after manual sends
         self.thumbnail_cache = {}  # Cache for PhotoImage objects
+        self._preset_rows = []  # (content key, row frame, thumbnail key) per displayed preset
+        self._preset_empty_label = None
+        self._preset_build_job = None  # after_idle job building the next batch of preset rows
+        self._preview_pool = None  # Worker threads decoding preview PNGs, created on first use
+        self._thumb_canvas = None  # Reused 64x16 drawing surface and 2x buffer for text previews
+        self._save_preset_dialogs = {}  # Reused "Save Preset" dialogs by preset type
+        self._save_presets_job = None
+        self._save_settings_pending = None
+        self._settings_write_lock = threading.Lock()
+        self._settings_pending_data = None  # Newest serialized settings waiting for the writer
+        self._settings_write_event = threading.Event()
         self.load_presets()
         self.settings = self.load_settings()
         self.secrets = self.load_secrets()
@@ -84,7 +342,7 @@ class iPixelController:
                 }]
                 if not self.settings.get('text_sprite_font_name'):
                     self.settings['text_sprite_font_name'] = 'Default'
-                self.save_settings()
+                self._schedule_save_settings()
             else:
                 self.settings['sprite_fonts'] = [
                     {
@@ -110,7 +368,7 @@ class iPixelController:
                     self.settings['youtube_sprite_font_name'] = 'Text Default'
                 if not self.settings.get('clock_time_sprite_font_name'):
                     self.settings['clock_time_sprite_font_name'] = 'Clock Default'
-                self.save_settings()
+                self._schedule_save_settings()
 
         self._ensure_default_sprite_fonts()
         
@@ -122,11 +380,19 @@ class iPixelController:
         self.teams_last_error = None
         self.teams_timer = None
         self.teams_debug_info = None
+        self._teams_token_expiry = 0
+        self._teams_token_refresh_lock = threading.Lock()
+        self._teams_fetch_inflight = threading.Event()
+        self._teams_presence_etag = None
+        self._teams_presence_url = None
+        self._teams_presence_cached = None
+        self._teams_unchanged_streak = 0
         self.stock_refresh_timer = None
         self.stock_static_timer = None
         self.sprite_scroll_timer = None
         self.sprite_scroll_running = False
         self.text_static_timer = None
+        self._text_cycle_run = 0  # Bumped when a text part cycle is cancelled; queued parts carry it
         self.countdown_static_timer = None
         
         # Setup UI
@@ -135,6 +401,14 @@ class iPixelController:
         # Start async event loop in separate thread
         self.start_event_loop()
         
+        # Presets are applied by a latest-wins worker
+        threading.Thread(target=self._preset_worker, daemon=True).start()
+        # Settings are written the same way, so an older snapshot never lands last
+        threading.Thread(target=self._settings_writer, daemon=True).start()
+        
+        # Flush pending writes before the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         # Auto-connect to last device if enabled
         if self.settings.get('auto_connect', True):
             self.root.after(1000, self.auto_connect_to_last_device)
@@ -308,6 +582,8 @@ class iPixelController:
         
         # Render preset buttons
         self.refresh_preset_buttons()
+        # Previews of deleted or edited text presets are cleared once per session
+        self.root.after_idle(self._prune_text_previews)
         
     def create_text_tab(self):
         """Create the text control tab"""
@@ -678,6 +954,7 @@ class iPixelController:
         ttk.Label(countdown_color_frame, text="Text Color:").pack(side=tk.LEFT, padx=(0, 5))
         
         self.countdown_color = "#00ff00"  # Green default
+        self._countdown_color_hex = self.countdown_color.lstrip('#')  # Device form, kept in sync by the chooser
         self.countdown_color_canvas = tk.Canvas(countdown_color_frame, width=30, height=20, 
                                                bg=self.countdown_color, relief=tk.SUNKEN)
         self.countdown_color_canvas.pack(side=tk.LEFT, padx=(0, 5))
@@ -687,6 +964,7 @@ class iPixelController:
         ttk.Label(countdown_color_frame, text="Background:").pack(side=tk.LEFT, padx=(0, 5))
         
         self.countdown_bg_color = "#FFFFFF"
+        self._countdown_bg_color_hex = self.countdown_bg_color.lstrip('#')
         self.countdown_bg_color_canvas = tk.Canvas(countdown_color_frame, width=30, height=20, 
                                                    bg=self.countdown_bg_color, relief=tk.SUNKEN)
         self.countdown_bg_color_canvas.pack(side=tk.LEFT, padx=(0, 5))
@@ -760,6 +1038,13 @@ class iPixelController:
         # Initialize clock update timer
         self.clock_timer = None
         self.clock_running = False
+        self._clock_run = 0  # Bumped on every clock/countdown start and stop; queued ticks carry it
+        self._clock_send_inflight = threading.Event()
+        self._last_time_render = (None, None)  # (render key, 64x16 clock image)
+        self._last_countdown_payload = None  # What the countdown last sent, to skip identical static updates
+        self._last_clock_payload = None  # Same for the live clock
+        self._last_frames_key = None  # Inputs of the last static countdown frame cycle
+        self._last_frames = None
         
         # Update initial visibility
         self.update_clock_options()
@@ -964,9 +1249,9 @@ class iPixelController:
                 previous_close = info.get('previousClose') or info.get('regularMarketPreviousClose')
                 
                 if current_price is None:
-                    self.root.after(0, lambda: self.stock_info_label.config(
+                    self._ui(self.stock_info_label.config,
                         text=f"Could not fetch data for {ticker}. Check ticker symbol.", 
-                        foreground="red"))
+                        foreground="red")
                     return
                 
                 change = current_price - previous_close if previous_close else 0
@@ -998,13 +1283,13 @@ class iPixelController:
                 self.root.after(0, update_ui)
                 
             except ImportError:
-                self.root.after(0, lambda: messagebox.showerror(
+                self._ui(messagebox.showerror,
                     "Missing Library", 
-                    "yfinance library not installed.\n\nInstall with: pip install yfinance"))
+                    "yfinance library not installed.\n\nInstall with: pip install yfinance")
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda: self.stock_info_label.config(
-                    text=f"Error: {error_msg}", foreground="red"))
+                self._ui(self.stock_info_label.config,
+                    text=f"Error: {error_msg}", foreground="red")
         
         threading.Thread(target=fetch_task, daemon=True).start()
     
@@ -1064,14 +1349,10 @@ class iPixelController:
                     )
                     if sprite_img is None:
                         raise Exception(sprite_err or "Sprite render failed")
-                    tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_stock_sprite.png')
-                    sprite_img.save(tmp_path, 'PNG')
-                    result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                    if asyncio.iscoroutine(result):
-                        self.run_async(result)
+                    self._send_pil_image(sprite_img, 'ipixel_stock_sprite.png')
                 except Exception as e:
                     error_msg = str(e)
-                    self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to send: {error_msg}"))
+                    self._ui(messagebox.showerror, "Error", f"Failed to send: {error_msg}")
 
             threading.Thread(target=send_task, daemon=True).start()
 
@@ -1117,27 +1398,8 @@ class iPixelController:
     
     def save_stock_preset(self):
         """Save current stock configuration as a preset"""
-        # Ask for preset name
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Save Stock Preset")
-        dialog.geometry("400x120")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        ttk.Label(dialog, text="Preset Name:").pack(pady=(20, 5))
-        name_entry = ttk.Entry(dialog, width=40)
-        name_entry.pack(pady=(0, 10))
-        name_entry.insert(0, f"Stock - {self.stock_ticker_var.get()}")
-        name_entry.focus()
-        name_entry.select_range(0, tk.END)
-        
-        def save():
-            name = name_entry.get().strip()
-            if not name:
-                messagebox.showwarning("No Name", "Please enter a preset name")
-                return
-            
-            preset = {
+        def build_preset(name):
+            return {
                 "name": name,
                 "type": "stock",
                 "ticker": self.stock_ticker_var.get(),
@@ -1150,13 +1412,53 @@ class iPixelController:
                 "stock_sprite_font_name": self.stock_sprite_font_var.get().strip(),
                 "stock_static_delay_seconds": int(self.stock_static_delay_var.get() or 2)
             }
+        
+        self._show_save_preset_dialog("stock", "Save Stock Preset",
+                                      f"Stock - {self.stock_ticker_var.get()}", build_preset)
+    
+    def _show_save_preset_dialog(self, kind, title, default_name, build_preset):
+        """Show the (reused) preset name dialog for the given preset kind"""
+        entry = self._save_preset_dialogs.get(kind)
+        if entry is None or not entry['dialog'].winfo_exists():
+            dialog = tk.Toplevel(self.root)
+            dialog.title(title)
+            dialog.geometry("400x120")
+            dialog.transient(self.root)
             
-            self.presets.append(preset)
-            self.save_presets()
-            self.refresh_preset_buttons()
-            dialog.destroy()
+            ttk.Label(dialog, text="Preset Name:").pack(pady=(20, 5))
+            name_entry = ttk.Entry(dialog, width=40)
+            name_entry.pack(pady=(0, 10))
+            
+            entry = {'dialog': dialog, 'name_entry': name_entry, 'build': build_preset}
+            
+            def hide():
+                dialog.grab_release()
+                dialog.withdraw()
+            
+            def save():
+                name = name_entry.get().strip()
+                if not name:
+                    messagebox.showwarning("No Name", "Please enter a preset name")
+                    return
+                
+                self.presets.append(entry['build'](name))
+                self._schedule_save_presets()
+                self.refresh_preset_buttons()
+                hide()
+            
+            ttk.Button(dialog, text="Save", command=save).pack(pady=10)
+            dialog.protocol("WM_DELETE_WINDOW", hide)
+            self._save_preset_dialogs[kind] = entry
+        else:
+            entry['dialog'].deiconify()
         
-        ttk.Button(dialog, text="Save", command=save).pack(pady=10)
+        entry['build'] = build_preset
+        name_entry = entry['name_entry']
+        name_entry.delete(0, tk.END)
+        name_entry.insert(0, default_name)
+        name_entry.focus()
+        name_entry.select_range(0, tk.END)
+        entry['dialog'].grab_set()
     
     def create_youtube_tab(self):
         """Create the YouTube stats display tab"""
@@ -1453,6 +1755,8 @@ class iPixelController:
         # Store data
         self.current_weather_data = None
         self.weather_refresh_job = None
+        self._last_weather_fetch = 0
+        self._last_weather_key = None
         
         # Load saved API key
         self.load_weather_api_key()
@@ -1570,6 +1874,8 @@ class iPixelController:
         # Store state
         self.animation_running = False
         self.animation_timer = None
+        self._anim_run = 0  # Bumped on every start and stop; queued frames carry it
+        self._anim_send_inflight = threading.Event()
         
         # Update initial visibility
         self.update_anim_options()
@@ -1634,8 +1940,8 @@ class iPixelController:
                     ).execute()
                     
                     if not search_response.get('items'):
-                        self.root.after(0, lambda: self.youtube_info_label.config(
-                            text=f"Channel not found: {channel_input}", foreground="red"))
+                        self._ui(self.youtube_info_label.config,
+                            text=f"Channel not found: {channel_input}", foreground="red")
                         return
                     
                     channel_id = search_response['items'][0]['id']['channelId']
@@ -1649,8 +1955,8 @@ class iPixelController:
                 ).execute()
                 
                 if not channel_response.get('items'):
-                    self.root.after(0, lambda: self.youtube_info_label.config(
-                        text=f"Channel not found: {channel_input}", foreground="red"))
+                    self._ui(self.youtube_info_label.config,
+                        text=f"Channel not found: {channel_input}", foreground="red")
                     return
                 
                 channel_data = channel_response['items'][0]
@@ -1685,15 +1991,28 @@ class iPixelController:
                 self.root.after(0, update_ui)
                 
             except ImportError:
-                self.root.after(0, lambda: messagebox.showerror(
+                self._ui(messagebox.showerror,
                     "Missing Library", 
-                    "Google API library not installed.\n\nInstall with: pip install google-api-python-client"))
+                    "Google API library not installed.\n\nInstall with: pip install google-api-python-client")
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda: self.youtube_info_label.config(
-                    text=f"Error: {error_msg}", foreground="red"))
+                self._ui(self.youtube_info_label.config,
+                    text=f"Error: {error_msg}", foreground="red")
         
-        threading.Thread(target=fetch_task, daemon=True).start()
+        if self.loop:
+            # The Google client is synchronous; run it on the shared loop's executor
+            async def run_fetch():
+                await asyncio.get_running_loop().run_in_executor(None, fetch_task)
+            
+            def fetch_done(future):
+                # fetch_task reports its own errors; this catches anything that escaped it
+                if not future.cancelled() and future.exception() is not None:
+                    self._ui(self.youtube_info_label.config,
+                        text=f"Error: {future.exception()}", foreground="red")
+            
+            asyncio.run_coroutine_threadsafe(run_fetch(), self.loop).add_done_callback(fetch_done)
+        else:
+            threading.Thread(target=fetch_task, daemon=True).start()
     
     def format_number(self, num):
         """Format large numbers with K/M/B suffixes"""
@@ -1743,11 +2062,7 @@ class iPixelController:
                 )
                 if sprite_img is None:
                     raise Exception(sprite_err or "Sprite render failed")
-                tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_youtube_sprite.png')
-                sprite_img.save(tmp_path, 'PNG')
-                result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                if asyncio.iscoroutine(result):
-                    self.run_async(result)
+                self._send_pil_image(sprite_img, 'ipixel_youtube_sprite.png')
 
                 if self.youtube_auto_refresh_var.get():
                     def auto_refresh():
@@ -1761,11 +2076,11 @@ class iPixelController:
                     self.youtube_refresh_job = self.root.after(interval_ms, auto_refresh)
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to send: {error_msg}"))
+                self._ui(messagebox.showerror, "Error", f"Failed to send: {error_msg}")
 
         def _send_logo_inline():
             logo_path = self._resolve_asset_path(self.youtube_logo_path_var.get().strip())
-            if not logo_path or not os.path.exists(logo_path):
+            if not self._asset_exists(logo_path):
                 return False, f"Logo file not found: {logo_path or self.youtube_logo_path_var.get().strip()}"
             try:
                 logo = Image.open(logo_path).convert("RGBA")
@@ -1798,10 +2113,7 @@ class iPixelController:
                     canvas.paste(line_img, (paste_x, 0))
                 else:
                     draw = ImageDraw.Draw(canvas)
-                    try:
-                        font = ImageFont.truetype("arial.ttf", 10)
-                    except Exception:
-                        font = ImageFont.load_default()
+                    font = _youtube_font()
                     bbox = draw.textbbox((0, 0), subs_text, font=font)
                     text_w = bbox[2] - bbox[0]
                     text_h = bbox[3] - bbox[1]
@@ -1809,11 +2121,7 @@ class iPixelController:
                     x = text_x + max(0, ((64 - text_x) - text_w) // 2)
                     draw.text((x, y), subs_text, font=font, fill=self.youtube_text_color)
 
-                tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_youtube_logo_inline.png')
-                canvas.convert("RGB").save(tmp_path, 'PNG')
-                result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                if asyncio.iscoroutine(result):
-                    self.run_async(result)
+                self._send_pil_image(canvas.convert("RGB"), 'ipixel_youtube_logo_inline.png')
                 return True, ""
             except Exception as e:
                 return False, str(e)
@@ -1822,7 +2130,7 @@ class iPixelController:
             try:
                 ok, err = _send_logo_inline()
                 if not ok:
-                    self.root.after(0, lambda: messagebox.showwarning("Logo Not Found", err))
+                    self._ui(messagebox.showwarning, "Logo Not Found", err)
                 else:
                     if self.youtube_auto_refresh_var.get():
                         def auto_refresh():
@@ -1838,32 +2146,14 @@ class iPixelController:
                 send_stats()
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to send: {error_msg}"))
+                self._ui(messagebox.showerror, "Error", f"Failed to send: {error_msg}")
 
         threading.Thread(target=send_task, daemon=True).start()
     
     def save_youtube_preset(self):
         """Save YouTube configuration as preset"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Save YouTube Preset")
-        dialog.geometry("400x120")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        ttk.Label(dialog, text="Preset Name:").pack(pady=(20, 5))
-        name_entry = ttk.Entry(dialog, width=40)
-        name_entry.pack(pady=(0, 10))
-        name_entry.insert(0, f"YouTube - {self.youtube_channel_var.get()}")
-        name_entry.focus()
-        name_entry.select_range(0, tk.END)
-        
-        def save():
-            name = name_entry.get().strip()
-            if not name:
-                messagebox.showwarning("No Name", "Please enter a preset name")
-                return
-            
-            preset = {
+        def build_preset(name):
+            return {
                 "name": name,
                 "type": "youtube",
                 "channel": self.youtube_channel_var.get(),
@@ -1875,13 +2165,9 @@ class iPixelController:
                 "youtube_show_logo": self.youtube_show_logo_var.get(),
                 "youtube_logo_path": self.youtube_logo_path_var.get().strip()
             }
-            
-            self.presets.append(preset)
-            self.save_presets()
-            self.refresh_preset_buttons()
-            dialog.destroy()
         
-        ttk.Button(dialog, text="Save", command=save).pack(pady=10)
+        self._show_save_preset_dialog("youtube", "Save YouTube Preset",
+                                      f"YouTube - {self.youtube_channel_var.get()}", build_preset)
     
     # ===== Weather Methods =====
     def save_weather_api_key(self):
@@ -1922,29 +2208,15 @@ class iPixelController:
         """Persist weather temp image settings"""
         self.settings['weather_use_temp_images'] = self.weather_use_temp_images_var.get()
         self.settings['weather_temp_image_dir'] = self.weather_temp_image_dir_var.get().strip()
-        self.save_settings()
+        _resolve_temp_image.cache_clear()
+        self._schedule_save_settings()
 
     def _get_temp_image_path(self, temp_value, folder):
         """Resolve temperature image path based on current temp."""
         folder = self._resolve_asset_path(folder)
         if not folder:
             return None
-        temp_int = int(round(temp_value))
-        candidates = []
-        if temp_int < 0:
-            candidates.append(f"temp_minus_{abs(temp_int)}.png")
-            candidates.append(f"temp_-{abs(temp_int)}.png")
-        else:
-            candidates.append(f"temp_plus_{temp_int}.png")
-            candidates.append(f"temp_{temp_int}.png")
-            if temp_int == 0:
-                candidates.append("temp_0.png")
-                candidates.append("temp_plus_0.png")
-        for name in candidates:
-            path = os.path.join(folder, name)
-            if os.path.exists(path):
-                return path
-        return None
+        return _resolve_temp_image(int(round(temp_value)), folder)
     
     def fetch_weather_data(self):
         """Fetch current weather data"""
@@ -1959,24 +2231,30 @@ class iPixelController:
             messagebox.showwarning("No Location", "Please enter a location")
             return
         
+        unit = self.weather_unit_var.get()
+        
+        # OpenWeatherMap updates roughly every 10 minutes; reuse recent data
+        fetch_key = (location, unit)
+        if (self.current_weather_data and fetch_key == self._last_weather_key
+                and time.monotonic() - self._last_weather_fetch < 60):
+            # Still show it, so a manual Fetch visibly does something
+            self._show_weather_info(self.current_weather_data, cached=True)
+            return self.current_weather_data
+        
         self.weather_info_label.config(text=f"Fetching weather for {location}...", foreground="blue")
         
-        def fetch_task():
+        async def fetch_task():
             try:
-                import requests
-                
-                unit = self.weather_unit_var.get()
                 url = f"https://api.openweathermap.org/data/2.5/weather?q={location}&appid={api_key}&units={unit}"
                 
-                response = requests.get(url, timeout=10)
+                status, data = await self._http_get_json(url, timeout=10)
                 
-                if response.status_code != 200:
-                    self.root.after(0, lambda: self.weather_info_label.config(
-                        text=f"Error: {response.json().get('message', 'Unknown error')}", foreground="red"))
+                if status != 200:
+                    message = data.get('message', 'Unknown error') if isinstance(data, dict) else 'Unknown error'
+                    self._ui(self.weather_info_label.config,
+                        text=f"Error: {message}", foreground="red")
                     return
                 
-                data = response.json()
-                
                 temp = data['main']['temp']
                 feels_like = data['main']['feels_like']
                 condition = data['weather'][0]['main']
@@ -1997,29 +2275,59 @@ class iPixelController:
                     'wind_speed': wind_speed,
                     'unit': unit_symbol
                 }
+                self._last_weather_fetch = time.monotonic()
+                self._last_weather_key = fetch_key
                 
-                def update_ui():
-                    info_text = f"{city_name}\n"
-                    info_text += f"Temperature: {temp:.1f}°{unit_symbol}\n"
-                    info_text += f"Feels like: {feels_like:.1f}°{unit_symbol}\n"
-                    info_text += f"Condition: {description.title()}\n"
-                    info_text += f"Humidity: {humidity}%"
-                    
-                    self.weather_info_label.config(text=info_text, foreground="green")
-                    self.send_weather_btn.config(state=tk.NORMAL)
-                
-                self.root.after(0, update_ui)
+                self._ui(self._show_weather_info, self.current_weather_data)
                 
-            except ImportError:
-                self.root.after(0, lambda: messagebox.showerror(
-                    "Missing Library", 
-                    "requests library not installed.\n\nInstall with: pip install requests"))
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda: self.weather_info_label.config(
-                    text=f"Error: {error_msg}", foreground="red"))
+                self._ui(self.weather_info_label.config,
+                    text=f"Error: {error_msg}", foreground="red")
         
-        threading.Thread(target=fetch_task, daemon=True).start()
+        if self.loop:
+            asyncio.run_coroutine_threadsafe(fetch_task(), self.loop)
+        else:
+            threading.Thread(target=lambda: asyncio.run(fetch_task()), daemon=True).start()
+    
+    def _show_weather_info(self, data, cached=False):
+        """Show weather data in the info label and enable sending it"""
+        unit_symbol = data['unit']
+        info_text = f"{data['city']}\n"
+        info_text += f"Temperature: {data['temp']:.1f}°{unit_symbol}\n"
+        info_text += f"Feels like: {data['feels_like']:.1f}°{unit_symbol}\n"
+        info_text += f"Condition: {data['description'].title()}\n"
+        info_text += f"Humidity: {data['humidity']}%"
+        if cached:
+            info_text += "\n(using cached weather, under a minute old)"
+        
+        self.weather_info_label.config(text=info_text, foreground="green")
+        self.send_weather_btn.config(state=tk.NORMAL)
+    
+    async def _get_aio_session(self):
+        """Return the shared aiohttp session, creating it on the event loop"""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession()
+        return self._aio_session
+    
+    async def _http_get_json(self, url, timeout=10):
+        """GET a JSON resource and return (status, data)"""
+        if aiohttp is not None and self.loop and asyncio.get_running_loop() is self.loop:
+            session = await self._get_aio_session()
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                try:
+                    data = await response.json(content_type=None)
+                except Exception:
+                    data = {}
+                return response.status, data
+        
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(None, lambda: self.http.get(url, timeout=timeout))
+        try:
+            data = response.json()
+        except Exception:
+            data = {}
+        return response.status_code, data
     
     def send_weather_to_display(self):
         """Send weather data to the LED display"""
@@ -2088,32 +2396,14 @@ class iPixelController:
                 
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to send: {error_msg}"))
+                self._ui(messagebox.showerror, "Error", f"Failed to send: {error_msg}")
         
         threading.Thread(target=send_task, daemon=True).start()
     
     def save_weather_preset(self):
         """Save weather configuration as preset"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Save Weather Preset")
-        dialog.geometry("400x120")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        ttk.Label(dialog, text="Preset Name:").pack(pady=(20, 5))
-        name_entry = ttk.Entry(dialog, width=40)
-        name_entry.pack(pady=(0, 10))
-        name_entry.insert(0, f"Weather - {self.weather_location_var.get()}")
-        name_entry.focus()
-        name_entry.select_range(0, tk.END)
-        
-        def save():
-            name = name_entry.get().strip()
-            if not name:
-                messagebox.showwarning("No Name", "Please enter a preset name")
-                return
-            
-            preset = {
+        def build_preset(name):
+            return {
                 "name": name,
                 "type": "weather",
                 "location": self.weather_location_var.get(),
@@ -2126,13 +2416,9 @@ class iPixelController:
                 "auto_refresh": self.weather_auto_refresh_var.get(),
                 "refresh_interval": self.weather_refresh_interval_var.get()
             }
-            
-            self.presets.append(preset)
-            self.save_presets()
-            self.refresh_preset_buttons()
-            dialog.destroy()
         
-        ttk.Button(dialog, text="Save", command=save).pack(pady=10)
+        self._show_save_preset_dialog("weather", "Save Weather Preset",
+                                      f"Weather - {self.weather_location_var.get()}", build_preset)
     
     # ===== Animation Methods =====
     def update_anim_options(self):
@@ -2146,20 +2432,35 @@ class iPixelController:
     
     def generate_game_of_life_frame(self, width=64, height=16, state=None):
         """Generate one frame of Conway's Game of Life"""
-        import numpy as np
-        
         if state is None:
             # Initialize with random state
             density = self.gol_density_var.get() / 100
             state = np.random.random((height, width)) < density
         
-        # Count neighbors
-        padded = np.pad(state, 1, mode='wrap')
-        neighbors = sum([
-            padded[0:-2, 0:-2], padded[0:-2, 1:-1], padded[0:-2, 2:],
-            padded[1:-1, 0:-2],                    padded[1:-1, 2:],
-            padded[2:,   0:-2], padded[2:,   1:-1], padded[2:,   2:]
-        ])
+        if _gol_step is not None:
+            # Ping-pong between two preallocated buffers with the numba kernel
+            bufs = getattr(self, '_gol_bufs', None)
+            if bufs is None or bufs[0].shape != (height, width):
+                bufs = (np.empty((height, width), np.uint8), np.empty((height, width), np.uint8))
+                self._gol_bufs = bufs
+            if state.dtype != np.uint8:
+                state = state.astype(np.uint8)
+            out = bufs[1] if state is bufs[0] else bufs[0]
+            _gol_step(state, out)
+            return out
+        
+        # Count neighbors using a reusable wrap-padded buffer
+        pad = getattr(self, '_gol_pad', None)
+        if pad is None or pad.shape != (height + 2, width + 2):
+            pad = np.empty((height + 2, width + 2), np.uint8)
+            self._gol_pad = pad
+        pad[1:-1, 1:-1] = state
+        pad[0, 1:-1] = state[-1]
+        pad[-1, 1:-1] = state[0]
+        pad[:, 0] = pad[:, -2]
+        pad[:, -1] = pad[:, 1]
+        windows = np.lib.stride_tricks.sliding_window_view(pad, (3, 3))
+        neighbors = windows.sum(axis=(-1, -2)) - state
         
         # Apply rules
         new_state = (neighbors == 3) | (state & (neighbors == 2))
@@ -2168,14 +2469,16 @@ class iPixelController:
     
     def generate_animation_frame(self, frame_num, width=64, height=16):
         """Generate animation frame based on type"""
-        import numpy as np
-        
         anim_type = self.anim_type_var.get()
         color_scheme = self.anim_color_scheme_var.get()
         
-        # Create RGB image
-        img = Image.new('RGB', (width, height), (0, 0, 0))
-        pixels = img.load()
+        # Draw into a reusable RGB buffer instead of allocating a new image
+        buf = self._anim_buf
+        if buf is None or buf.shape != (height, width, 3):
+            buf = np.zeros((height, width, 3), np.uint8)
+            self._anim_buf = buf
+        else:
+            buf.fill(0)
         
         if anim_type == "game_of_life":
             if not hasattr(self, 'gol_state') or frame_num == 0:
@@ -2184,27 +2487,27 @@ class iPixelController:
                 self.gol_state = self.generate_game_of_life_frame(width, height, self.gol_state)
             
             # Apply color scheme
-            for y in range(height):
-                for x in range(width):
-                    if self.gol_state[y, x]:
-                        pixels[x, y] = self.get_color_for_scheme(color_scheme, frame_num, x, y)
+            ys, xs = np.nonzero(self.gol_state)
+            buf[ys, xs] = self._scheme_colors(color_scheme, frame_num, xs, ys)
         
         elif anim_type == "matrix":
             # Matrix rain effect
             if not hasattr(self, 'matrix_drops'):
-                self.matrix_drops = [np.random.randint(-height, 0) for _ in range(width)]
+                self.matrix_drops = np.random.randint(-height, 0, size=width)
             
-            for x in range(width):
-                self.matrix_drops[x] += 1
-                if self.matrix_drops[x] > height:
-                    self.matrix_drops[x] = np.random.randint(-height//2, 0)
-                
-                # Draw trail
-                for trail in range(5):
-                    y = self.matrix_drops[x] - trail
-                    if 0 <= y < height:
-                        brightness = max(0, 255 - trail * 50)
-                        pixels[x, y] = (0, brightness, 0) if color_scheme == "green" else (brightness, brightness, brightness)
+            drops = self.matrix_drops
+            drops += 1
+            reset = drops > height
+            drops[reset] = np.random.randint(-height//2, 0, size=int(reset.sum()))
+            
+            # Draw trail
+            columns = np.arange(width)
+            for trail in range(5):
+                y = drops - trail
+                visible = (y >= 0) & (y < height)
+                brightness = max(0, 255 - trail * 50)
+                color = (0, brightness, 0) if color_scheme == "green" else (brightness, brightness, brightness)
+                buf[y[visible], columns[visible]] = color
         
         elif anim_type == "fire":
             # Fire effect
@@ -2212,57 +2515,87 @@ class iPixelController:
                 self.fire_buffer = np.zeros((height, width))
             
             # Heat bottom row
-            self.fire_buffer[-1, :] = np.random.randint(200, 256, width)
+            fire = self.fire_buffer
+            fire[-1, :] = np.random.randint(200, 256, width)
             
             # Propagate and cool
-            for y in range(height-1):
-                for x in range(width):
-                    avg = (self.fire_buffer[y+1, (x-1)%width] + 
-                          self.fire_buffer[y+1, x] + 
-                          self.fire_buffer[y+1, (x+1)%width]) / 3
-                    self.fire_buffer[y, x] = max(0, avg - np.random.randint(0, 10))
+            below = fire[1:]
+            avg = (np.roll(below, 1, axis=1) + below + np.roll(below, -1, axis=1)) / 3
+            fire[:-1] = np.maximum(0, avg - np.random.randint(0, 10, size=below.shape))
             
             # Apply fire colors
-            for y in range(height):
-                for x in range(width):
-                    heat = int(self.fire_buffer[y, x])
-                    if heat < 85:
-                        pixels[x, y] = (heat * 3, 0, 0)
-                    elif heat < 170:
-                        pixels[x, y] = (255, (heat-85) * 3, 0)
-                    else:
-                        pixels[x, y] = (255, 255, (heat-170) * 3)
+            heat = fire.astype(np.int32)
+            low = heat < 85
+            mid = (heat >= 85) & (heat < 170)
+            high = heat >= 170
+            buf[low, 0] = heat[low] * 3
+            buf[mid, 0] = 255
+            buf[mid, 1] = (heat[mid] - 85) * 3
+            buf[high, 0:2] = 255
+            buf[high, 2] = (heat[high] - 170) * 3
         
         elif anim_type == "starfield":
             # Starfield effect
-            if not hasattr(self, 'stars'):
-                self.stars = [(np.random.randint(0, width), np.random.randint(0, height), 
-                              np.random.randint(1, 4)) for _ in range(30)]
+            if not hasattr(self, 'star_xy'):
+                self.star_xy = np.random.randint(0, [width, height], size=(30, 2), dtype=np.int32)
+                self.star_speed = np.random.randint(1, 4, size=30, dtype=np.int32)
             
             # Move stars
-            new_stars = []
-            for x, y, speed in self.stars:
-                x += speed
-                if x >= width:
-                    x = 0
-                    y = np.random.randint(0, height)
-                new_stars.append((x, y, speed))
-            self.stars = new_stars
+            xs = self.star_xy[:, 0]
+            ys = self.star_xy[:, 1]
+            xs += self.star_speed
+            wrap = xs >= width
+            xs[wrap] = 0
+            ys[wrap] = np.random.randint(0, height, size=int(wrap.sum()))
             
             # Draw stars
-            for x, y, speed in self.stars:
-                brightness = 100 + speed * 50
-                pixels[x, y] = self.get_color_for_scheme(color_scheme, frame_num, x, y, brightness)
+            brightness = 100 + self.star_speed * 50
+            buf[ys, xs] = self._scheme_colors(color_scheme, frame_num, xs, ys, brightness)
         
         elif anim_type == "plasma":
-            # Plasma effect
-            for y in range(height):
-                for x in range(width):
-                    v = np.sin(x / 4.0 + frame_num / 10.0) + np.sin(y / 3.0 + frame_num / 15.0)
-                    v = (v + 2) / 4 * 255
-                    pixels[x, y] = self.get_color_for_scheme(color_scheme, int(v), x, y)
+            # Plasma effect (phase tables are computed once per resolution)
+            if self._plasma_x is None or self._plasma_x.shape[0] != width or self._plasma_y.shape[0] != height:
+                self._plasma_x = np.arange(width) / 4.0
+                self._plasma_y = np.arange(height) / 3.0
+                self._plasma_xy = np.add.outer(np.arange(height), np.arange(width))
+            v = np.sin(self._plasma_x + frame_num / 10.0)[None, :] + np.sin(self._plasma_y + frame_num / 15.0)[:, None]
+            v = ((v + 2) * 63.75).astype(np.uint8)
+            # Hue also depends on position for rainbow, so it gets a 360-entry palette
+            size = 360 if color_scheme == "rainbow" else 256
+            if self._plasma_palette is None or self._plasma_palette[0] != color_scheme:
+                zeros = np.zeros(size, np.int32)
+                self._plasma_palette = (color_scheme, self._scheme_colors(color_scheme, np.arange(size), zeros, zeros))
+            palette = self._plasma_palette[1]
+            if color_scheme == "rainbow":
+                buf[:] = palette[(v + self._plasma_xy) % 360]
+            else:
+                buf[:] = palette[v]
         
-        return img
+        return Image.frombuffer('RGB', (width, height), buf, 'raw', 'RGB', 0, 1)
+    
+    def _scheme_colors(self, scheme, frame_num, xs, ys, brightness=255):
+        """Vectorized get_color_for_scheme over arrays of pixel coordinates"""
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        brightness = np.broadcast_to(np.asarray(brightness, dtype=np.int32), xs.shape)
+        out = np.zeros(xs.shape + (3,), np.uint8)
+        if scheme == "rainbow":
+            # Integer HSV -> RGB (full saturation) using the six hue sectors
+            hue = (np.asarray(frame_num, dtype=np.int32) + xs + ys) % 360
+            sector = hue // 60
+            t = (hue % 60) * 255 // 60
+            q = 255 - t
+            p = np.zeros_like(t)
+            full = np.full_like(t, 255)
+            out[..., 0] = np.choose(sector, [full, q, p, p, t, full]) * brightness // 255
+            out[..., 1] = np.choose(sector, [t, full, full, q, p, p]) * brightness // 255
+            out[..., 2] = np.choose(sector, [p, p, t, full, full, q]) * brightness // 255
+            return out
+        
+        channels = {"green": (1,), "blue": (2,), "red": (0,)}.get(scheme, (0, 1, 2))
+        for channel in channels:
+            out[..., channel] = brightness
+        return out
     
     def get_color_for_scheme(self, scheme, frame_num, x=0, y=0, brightness=255):
         """Get color based on scheme"""
@@ -2275,10 +2608,7 @@ class iPixelController:
         elif scheme == "white":
             return (brightness, brightness, brightness)
         elif scheme == "rainbow":
-            hue = (frame_num + x + y) % 360
-            import colorsys
-            rgb = colorsys.hsv_to_rgb(hue/360, 1.0, brightness/255)
-            return tuple(int(c * 255) for c in rgb)
+            return tuple(int(c) for c in self._scheme_colors(scheme, frame_num, x, y, brightness))
         return (brightness, brightness, brightness)
     
     def send_animation_to_display(self):
@@ -2307,8 +2637,14 @@ class iPixelController:
             del self.matrix_drops
         if hasattr(self, 'fire_buffer'):
             del self.fire_buffer
-        if hasattr(self, 'stars'):
-            del self.stars
+        if hasattr(self, 'star_xy'):
+            del self.star_xy
+            del self.star_speed
+        
+        # Frames go out through the BLE queue while the next one is generated
+        self._anim_run += 1
+        run = self._anim_run
+        self._anim_send_inflight.clear()
         
         def send_next_frame():
             if not self.animation_running or frame_count[0] >= total_frames:
@@ -2316,29 +2652,13 @@ class iPixelController:
                 return
             
             try:
-                # Generate frame
                 frame_img = self.generate_animation_frame(frame_count[0])
                 
-                # Save to temp file
-                temp_path = os.path.join(tempfile.gettempdir(), 'ipixel_anim_frame.png')
-                frame_img.save(temp_path, 'PNG')
-                
-                # Send to display synchronously to avoid overwhelming the device
-                def send_task():
-                    try:
-                        import time
-                        result = self.client.send_image(temp_path, resize_method='crop', save_slot=0)
-                        if asyncio.iscoroutine(result):
-                            self.run_async(result)
-                        # Small delay to ensure device has time to process
-                        time.sleep(0.05)  # 50ms delay between frames
-                    except Exception as e:
-                        print(f"Frame send error: {e}")
-                
-                # Send synchronously in thread and wait
-                thread = threading.Thread(target=send_task, daemon=True)
-                thread.start()
-                thread.join(timeout=2.0)  # Wait up to 2 seconds for send to complete
+                # Drop the frame if the previous one has not reached the panel yet
+                if not self._anim_send_inflight.is_set():
+                    self._anim_send_inflight.set()
+                    # Copied, since the frame shares the reusable buffer
+                    self._enqueue_ble(self._anim_job(frame_img.copy(), run))
                 
                 frame_count[0] += 1
                 
@@ -2353,6 +2673,29 @@ class iPixelController:
         # Start animation
         send_next_frame()
     
+    def _anim_job(self, frame_img, run):
+        """Queued send of one animation frame, dropped once its animation stops or restarts"""
+        def job():
+            try:
+                if self.animation_running and self._anim_run == run:
+                    self._send_pil_image(frame_img, 'ipixel_anim_frame.png')
+                    # Small delay to ensure device has time to process
+                    time.sleep(0.05)  # 50ms delay between frames
+            except Exception as e:
+                self._ui(self._anim_send_failed, run, str(e))
+            finally:
+                # A newer animation manages its own in-flight flag
+                if self._anim_run == run:
+                    self._anim_send_inflight.clear()
+        return job
+    
+    def _anim_send_failed(self, run, error_msg):
+        """Stop the animation a frame send failed for and report it"""
+        if not self.animation_running or self._anim_run != run:
+            return
+        self.stop_animation()
+        messagebox.showerror("Error", f"Animation frame send failed: {error_msg}")
+    
     def stop_animation(self):
         """Stop the running animation"""
         self.animation_running = False
@@ -2361,31 +2704,17 @@ class iPixelController:
             self.root.after_cancel(self.animation_timer)
             self.animation_timer = None
         
+        # Frames still queued for this run are dropped when they come up
+        self._anim_run += 1
+        self._anim_send_inflight.clear()
+        
         self.send_anim_btn.config(state=tk.NORMAL if self.is_connected else tk.DISABLED)
         self.stop_anim_btn.config(state=tk.DISABLED)
     
     def save_animation_preset(self):
         """Save animation configuration as preset"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Save Animation Preset")
-        dialog.geometry("400x120")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        ttk.Label(dialog, text="Preset Name:").pack(pady=(20, 5))
-        name_entry = ttk.Entry(dialog, width=40)
-        name_entry.pack(pady=(0, 10))
-        name_entry.insert(0, f"Animation - {self.anim_type_var.get().replace('_', ' ').title()}")
-        name_entry.focus()
-        name_entry.select_range(0, tk.END)
-        
-        def save():
-            name = name_entry.get().strip()
-            if not name:
-                messagebox.showwarning("No Name", "Please enter a preset name")
-                return
-            
-            preset = {
+        def build_preset(name):
+            return {
                 "name": name,
                 "type": "animation",
                 "anim_type": self.anim_type_var.get(),
@@ -2394,13 +2723,10 @@ class iPixelController:
                 "duration": self.anim_duration_var.get(),
                 "gol_density": self.gol_density_var.get()
             }
-            
-            self.presets.append(preset)
-            self.save_presets()
-            self.refresh_preset_buttons()
-            dialog.destroy()
         
-        ttk.Button(dialog, text="Save", command=save).pack(pady=10)
+        self._show_save_preset_dialog("animation", "Save Animation Preset",
+                                      f"Animation - {self.anim_type_var.get().replace('_', ' ').title()}",
+                                      build_preset)
     
     def create_teams_status_tab(self):
         """Create the Teams Status monitoring tab"""
@@ -2513,7 +2839,7 @@ class iPixelController:
         """Save Teams status to preset mapping"""
         value = self.teams_preset_vars[setting_name].get()
         self.settings[setting_name] = value
-        self.save_settings()
+        self._schedule_save_settings()
     
     def authenticate_teams(self):
         """Authenticate with Microsoft Graph API for Teams presence"""
@@ -2593,6 +2919,7 @@ class iPixelController:
         self.secrets['teams_client_secret'] = ''
         self.secrets['teams_user_id'] = ''
         self.teams_access_token = None
+        self._teams_token_expiry = 0
         self.save_secrets()
         self.teams_auth_status_var.set("Not authenticated")
         messagebox.showinfo("Signed Out", "Microsoft Teams credentials have been removed.")
@@ -2617,6 +2944,7 @@ class iPixelController:
         self.start_teams_btn.config(state=tk.DISABLED)
         self.stop_teams_btn.config(state=tk.NORMAL)
         self.teams_monitor_status_var.set("Monitoring: Running ✓")
+        self._teams_unchanged_streak = 0
         
         # Start checking status
         self.check_teams_status()
@@ -2637,66 +2965,70 @@ class iPixelController:
         if not self.teams_monitoring:
             return
         
+        if not self.is_connected:
+            # Nothing to drive; recheck cheaply without hitting Graph
+            self.teams_timer = self.root.after(5000, self.check_teams_status)
+            return
+        
         def fetch_status():
             try:
                 user_id = self.secrets.get('teams_user_id', '').strip()
                 if not user_id:
-                    self.root.after(0, lambda: messagebox.showwarning(
-                        "Missing User", "Please provide a Teams User ID or UPN in the Teams settings."
-                    ))
-                    self.root.after(0, self.stop_teams_monitoring)
+                    self._ui(messagebox.showwarning,
+                             "Missing User", "Please provide a Teams User ID or UPN in the Teams settings.")
+                    self._ui(self.stop_teams_monitoring)
                     return
 
                 user_id_encoded = urllib.parse.quote(user_id, safe="")
-                self.root.after(0, lambda: self.teams_debug_var.set("Debug: checking presence..."))
-
-                # Get access token if needed
-                if not self.teams_access_token:
-                    token_response = self.get_teams_access_token()
-                    if not token_response:
-                        err = self.teams_last_error or "Authentication failed"
-                        self.root.after(0, lambda e=err: self.teams_current_status_var.set(f"Error: {e}"))
-                        self.root.after(0, lambda: messagebox.showerror(
-                            "Authentication Failed", 
-                            "Could not authenticate with Microsoft Graph API. Check your credentials."
-                        ))
-                        self.root.after(0, self.stop_teams_monitoring)
-                        return
-                    self.teams_access_token = token_response
+                self._ui(self.teams_debug_var.set, "Debug: checking presence...")
+
+                # Get access token (refreshed ahead of expiry)
+                access_token = self._ensure_teams_token()
+                if not access_token:
+                    err = self.teams_last_error or "Authentication failed"
+                    self._ui(self.teams_current_status_var.set, f"Error: {err}")
+                    self._ui(messagebox.showerror,
+                             "Authentication Failed",
+                             "Could not authenticate with Microsoft Graph API. Check your credentials.")
+                    self._ui(self.stop_teams_monitoring)
+                    return
                 
                 # Get user presence
                 headers = {
-                    'Authorization': f'Bearer {self.teams_access_token}',
+                    'Authorization': f'Bearer {access_token}',
                     'Content-Type': 'application/json'
                 }
+                presence_url = f'https://graph.microsoft.com/v1.0/users/{user_id_encoded}/presence'
+                if self._teams_presence_etag and self._teams_presence_url == presence_url:
+                    headers['If-None-Match'] = self._teams_presence_etag
                 
                 # Use Graph API to get presence
-                response = requests.get(
-                    f'https://graph.microsoft.com/v1.0/users/{user_id_encoded}/presence',
+                response = self.graph_http.get(
+                    presence_url,
                     headers=headers,
                     timeout=10
                 )
                 
-                if response.status_code == 401:
-                    # Token expired, refresh it
-                    self.teams_access_token = None
-                    self.root.after(0, self.check_teams_status)
-                    return
-                
-                if response.status_code == 200:
+                if response.status_code == 304 and self._teams_presence_cached is not None:
+                    # Presence unchanged since the last poll; nothing to re-render
+                    self._teams_unchanged_streak += 1
+                    self.teams_last_error = None
+                    self._ui(self.teams_debug_var.set, "Debug: presence OK (unchanged)")
+                elif response.status_code == 200:
                     data = response.json()
+                    self._teams_presence_etag = response.headers.get('ETag')
+                    self._teams_presence_url = presence_url
+                    self._teams_presence_cached = data
                     availability = data.get('availability', 'Unknown')
                     activity = data.get('activity', 'Unknown')
                     self.teams_last_error = None
-                    self.root.after(0, lambda: self.teams_debug_var.set("Debug: presence OK"))
+                    self._ui(self.teams_debug_var.set, "Debug: presence OK")
 
                     status_display = availability if availability and availability != 'Unknown' else activity
                     status_display = status_display if status_display else 'Unknown'
                     
                     # Update UI with current status
-                    self.root.after(0, lambda s=status_display, a=activity: self.teams_current_status_var.set(
-                        f"{s} ({a})"
-                    ))
+                    self._ui(self.teams_current_status_var.set, f"{status_display} ({activity})")
                     
                     # Check if status changed
                     status_key = availability
@@ -2704,33 +3036,60 @@ class iPixelController:
                         status_key = activity
 
                     if status_key != self.teams_last_status:
+                        self._teams_unchanged_streak = 0
                         self.teams_last_status = status_key
-                        self.root.after(0, lambda s=status_key: self.handle_teams_status_change(s))
+                        self._ui(self.handle_teams_status_change, status_key)
+                    else:
+                        self._teams_unchanged_streak += 1
                 else:
-                    error_summary = f"{response.status_code} {response.reason}" if hasattr(response, 'reason') else f"{response.status_code}"
+                    if response.status_code == 401:
+                        # Token was rejected; force a refresh on the next poll
+                        self._teams_token_expiry = 0
+                    reason = getattr(response, 'reason', None) or getattr(response, 'reason_phrase', None)
+                    error_summary = f"{response.status_code} {reason}" if reason else f"{response.status_code}"
                     self.teams_last_error = f"Presence error: {error_summary}"
-                    self.root.after(0, lambda e=self.teams_last_error: self.teams_current_status_var.set(f"Error: {e}"))
-                    self.root.after(0, lambda e=self.teams_last_error: self.teams_debug_var.set(f"Debug: {e}"))
+                    self._ui(self.teams_current_status_var.set, f"Error: {self.teams_last_error}")
+                    self._ui(self.teams_debug_var.set, f"Debug: {self.teams_last_error}")
                     print(f"Teams API error: {response.status_code} - {response.text}")
                     
             except Exception as e:
                 self.teams_last_error = f"Presence error: {e}"
-                self.root.after(0, lambda e=self.teams_last_error: self.teams_current_status_var.set(f"Error: {e}"))
-                self.root.after(0, lambda e=self.teams_last_error: self.teams_debug_var.set(f"Debug: {e}"))
+                self._ui(self.teams_current_status_var.set, f"Error: {self.teams_last_error}")
+                self._ui(self.teams_debug_var.set, f"Debug: {self.teams_last_error}")
                 print(f"Error checking Teams status: {e}")
-        
-        # Run in background thread
-        threading.Thread(target=fetch_status, daemon=True).start()
-        
-        # Schedule next check
-        interval = self.teams_refresh_var.get() * 1000
+            finally:
+                self._teams_fetch_inflight.clear()
+                # Pick the next interval only now, after this poll has updated the backoff
+                self._ui(self._schedule_teams_check)
+        
+        # Run in background thread; a poll still running schedules the next check itself
+        if not self._teams_fetch_inflight.is_set():
+            self._teams_fetch_inflight.set()
+            threading.Thread(target=fetch_status, daemon=True).start()
+    
+    def _schedule_teams_check(self):
+        """Arm the next presence poll, backing off (up to 5 minutes) while presence is unchanged"""
+        if not self.teams_monitoring:
+            return
+        if self.teams_timer:
+            self.root.after_cancel(self.teams_timer)
+        interval = min(self.teams_refresh_var.get() * 1000 * (2 ** min(self._teams_unchanged_streak, 4)),
+                       5 * 60 * 1000)
         self.teams_timer = self.root.after(interval, self.check_teams_status)
     
+    def _create_graph_client(self):
+        """HTTP/2 client for Graph calls when httpx is installed, else the shared requests session"""
+        if httpx:
+            try:
+                return httpx.Client(http2=True, timeout=10.0, limits=httpx.Limits(max_connections=2))
+            except ImportError:
+                # httpx without the h2 extra can't speak HTTP/2
+                pass
+        return self.http
+    
     def get_teams_access_token(self):
         """Get access token from Microsoft Graph API"""
         try:
-            import requests
-            
             tenant_id = self.secrets.get('teams_tenant_id')
             client_id = self.secrets.get('teams_client_id')
             client_secret = self.secrets.get('teams_client_secret')
@@ -2745,24 +3104,51 @@ class iPixelController:
                 'scope': 'https://graph.microsoft.com/.default'
             }
             
-            response = requests.post(token_url, data=data, timeout=10)
+            response = self.graph_http.post(token_url, data=data, timeout=10)
             
             if response.status_code == 200:
                 self.teams_last_error = None
-                self.root.after(0, lambda: self.teams_debug_var.set("Debug: token OK"))
-                return response.json()['access_token']
+                self._ui(self.teams_debug_var.set, "Debug: token OK")
+                payload = response.json()
+                return payload['access_token'], int(payload.get('expires_in', 3600))
             else:
                 self.teams_last_error = f"Token error: {response.status_code}"
-                self.root.after(0, lambda e=self.teams_last_error: self.teams_debug_var.set(f"Debug: {e}"))
+                self._ui(self.teams_debug_var.set, f"Debug: {self.teams_last_error}")
                 print(f"Token error: {response.status_code} - {response.text}")
                 return None
                 
         except Exception as e:
             self.teams_last_error = f"Token error: {e}"
-            self.root.after(0, lambda e=self.teams_last_error: self.teams_debug_var.set(f"Debug: {e}"))
+            self._ui(self.teams_debug_var.set, f"Debug: {self.teams_last_error}")
             print(f"Error getting access token: {e}")
             return None
     
+    def _refresh_teams_token(self):
+        """Fetch a new Graph token and record when it expires"""
+        with self._teams_token_refresh_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self.teams_access_token and time.monotonic() < self._teams_token_expiry - 180:
+                return self.teams_access_token
+            result = self.get_teams_access_token()
+            if not result:
+                return None
+            token, expires_in = result
+            self.teams_access_token = token
+            self._teams_token_expiry = time.monotonic() + expires_in
+            return token
+    
+    def _ensure_teams_token(self):
+        """Return a usable token, refreshing in the background when it is stale"""
+        now = time.monotonic()
+        if self.teams_access_token and now < self._teams_token_expiry - 180:
+            return self.teams_access_token
+        if self.teams_access_token and now < self._teams_token_expiry:
+            # Stale but still valid: refresh without blocking this poll
+            if not self._teams_token_refresh_lock.locked():
+                threading.Thread(target=self._refresh_teams_token, daemon=True).start()
+            return self.teams_access_token
+        return self._refresh_teams_token()
+    
     def handle_teams_status_change(self, status):
         """Handle Teams status change by activating corresponding preset"""
         # Map status to setting name
@@ -2784,12 +3170,16 @@ class iPixelController:
         if not preset_name or preset_name == "(None)":
             return
         
+        # Already showing this preset (e.g. Busy and InAMeeting share one)
+        if preset_name == self._current_preset_name:
+            return
+        
         # Find and execute the preset
-        for preset in self.presets:
-            if preset['name'] == preset_name:
-                self.execute_preset(preset)
-                print(f"Teams status changed to {status}, executed preset: {preset_name}")
-                break
+        preset = self._preset_by_name.get(preset_name)
+        if preset:
+            self._teams_unchanged_streak = 0
+            self.execute_preset(preset)
+            print(f"Teams status changed to {status}, executed preset: {preset_name}")
     
     def create_settings_tab(self):
         """Create the settings control tab"""
@@ -2869,37 +3259,87 @@ class iPixelController:
     def start_event_loop(self):
         """Start asyncio event loop in a separate thread"""
         def run_loop():
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_forever()
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            self._ble_queue = asyncio.Queue()
+            loop.create_task(self._ble_worker())
+            self.loop = loop
+            loop.call_soon(self._loop_ready.set)
+            loop.run_forever()
         
         thread = threading.Thread(target=run_loop, daemon=True)
         thread.start()
+    
+    async def _ble_worker(self):
+        """Run queued BLE sends one at a time on the event loop"""
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._ble_queue.get()
+            try:
+                # Jobs are blocking send functions; run them off the loop thread
+                # so they can still hand coroutines back via run_async
+                await loop.run_in_executor(None, job)
+            except Exception as e:
+                print(f"BLE job error: {e}")
+    
+    def _enqueue_ble(self, job):
+        """Queue a blocking send so BLE writes are serialized"""
+        if not self.loop or self._ble_queue is None:
+            threading.Thread(target=job, daemon=True).start()
+            return
+        self.loop.call_soon_threadsafe(self._ble_queue.put_nowait, job)
         
     def run_async(self, coro):
         """Run an async coroutine in the event loop"""
         if self.loop:
             future = asyncio.run_coroutine_threadsafe(coro, self.loop)
             return future.result(timeout=30)
-        
+    
+    def _ui(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) on the Tk thread; queued calls are drained in one callback"""
+        self._ui_queue.put((fn, args, kwargs))
+        with self._ui_lock:
+            if self._ui_pump_pending:
+                return
+            self._ui_pump_pending = True
+        self.root.after(0, self._pump_ui)
+    
+    def _pump_ui(self):
+        """Drain queued UI calls"""
+        with self._ui_lock:
+            self._ui_pump_pending = False
+        while True:
+            try:
+                fn, args, kwargs = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                print(f"UI callback error: {e}")
+    
     def scan_devices(self):
         """Scan for Bluetooth LE devices"""
         self.scan_btn.config(state=tk.DISABLED, text="Scanning...")
         self.device_combo['values'] = []
         
-        def scan_task():
-            try:
-                devices = self.run_async(self._scan_devices())
-                
-                # Update UI in main thread
-                self.root.after(0, lambda: self._update_device_list(devices))
-            except Exception as e:
-                error_msg = str(e)
-                self.root.after(0, lambda: messagebox.showerror("Scan Error", f"Failed to scan: {error_msg}"))
-            finally:
-                self.root.after(0, lambda: self.scan_btn.configure(state=tk.NORMAL, text="Scan"))
+        if not self.loop:
+            self.scan_btn.configure(state=tk.NORMAL, text="Scan")
+            messagebox.showerror("Scan Error", "Bluetooth event loop is not running yet")
+            return
         
-        threading.Thread(target=scan_task, daemon=True).start()
+        # Scan on the event loop; the result is marshalled back to the Tk thread
+        future = asyncio.run_coroutine_threadsafe(self._scan_devices(), self.loop)
+        future.add_done_callback(lambda f: self._ui(self._finish_scan, f))
+    
+    def _finish_scan(self, future):
+        """Apply scan results on the Tk thread"""
+        try:
+            self._update_device_list(future.result())
+        except Exception as e:
+            messagebox.showerror("Scan Error", f"Failed to scan: {e}")
+        finally:
+            self.scan_btn.configure(state=tk.NORMAL, text="Scan")
     
     async def _scan_devices(self):
         """Async method to scan for devices"""
@@ -2939,22 +3379,48 @@ class iPixelController:
         
         self.connect_btn.config(state=tk.DISABLED, text="Connecting...")
         
-        def connect_task():
-            try:
-                # Create client - this may handle connection internally
-                self.client = Client(self.device_address)
-                
-                # Try to connect if method exists and is callable
-                if hasattr(self.client, 'connect') and callable(self.client.connect):
-                    self.client.connect()
-                
-                # Update UI
-                self.root.after(0, self._on_connected)
-            except Exception as e:
-                error_msg = str(e)
-                self.root.after(0, lambda: self._on_connection_error(error_msg))
+        if not self.loop:
+            self._on_connection_error("Bluetooth event loop is not running yet")
+            return
         
-        threading.Thread(target=connect_task, daemon=True).start()
+        future = asyncio.run_coroutine_threadsafe(self._connect_client(self.device_address), self.loop)
+        future.add_done_callback(lambda f: self._ui(self._finish_connect, f))
+    
+    async def _connect_client(self, address):
+        """Create the client and connect it from the event loop"""
+        # Create client - this may handle connection internally
+        client = Client(address)
+        
+        # Try to connect if method exists and is callable
+        if hasattr(client, 'connect') and callable(client.connect):
+            # A synchronous connect must not block the event loop
+            result = await asyncio.get_running_loop().run_in_executor(None, client.connect)
+            if asyncio.iscoroutine(result):
+                await result
+        return client
+    
+    async def _disconnect_client(self, client):
+        """Disconnect the client from the event loop"""
+        # A synchronous disconnect must not block the event loop either
+        result = await asyncio.get_running_loop().run_in_executor(None, client.disconnect)
+        if asyncio.iscoroutine(result):
+            await result
+    
+    def _finish_disconnect(self, future):
+        """Report the disconnect result on the Tk thread"""
+        try:
+            future.result()
+        except Exception as e:
+            print(f"Disconnect error: {e}")
+    
+    def _finish_connect(self, future):
+        """Apply the connection result on the Tk thread"""
+        try:
+            self.client = future.result()
+        except Exception as e:
+            self._on_connection_error(str(e))
+            return
+        self._on_connected()
     
     def _on_connected(self):
         """Called when successfully connected"""
@@ -2962,7 +3428,7 @@ class iPixelController:
         
         # Save device address for auto-connect
         self.settings['last_device'] = self.device_address
-        self.save_settings()
+        self._schedule_save_settings()
         
         # Try to get device info
         device_info_text = "Connected"
@@ -2998,14 +3464,14 @@ class iPixelController:
     
     def disconnect_device(self):
         """Disconnect from the device"""
-        if self.client:
-            try:
-                self.run_async(self.client.disconnect())
-            except:
-                pass
-            
+        client = self.client
         self.is_connected = False
         self.client = None
+        self._current_preset_name = None
+        if client and self.loop:
+            future = asyncio.run_coroutine_threadsafe(self._disconnect_client(client), self.loop)
+            future.add_done_callback(lambda f: self._ui(self._finish_disconnect, f))
+        
         self.status_label.config(text="Disconnected", foreground="red")
         self.connect_btn.config(text="Connect")
         
@@ -3049,11 +3515,23 @@ class iPixelController:
             messagebox.showwarning("No Text", "Please enter text to display")
             return
 
+        # Reject a broken sprite font up front instead of failing inside the send
+        sprite_font = None
+        if self.text_use_sprite_var.get():
+            sprite_font = self._get_sprite_font_by_name(self.text_sprite_font_var.get().strip())
+            if not sprite_font:
+                messagebox.showerror("Error", "Sprite font not found")
+                return
+            sprite_err = self._validate_sprite_font(sprite_font)
+            if sprite_err:
+                messagebox.showerror("Error", f"Sprite load failed: {sprite_err}")
+                return
+
         self._stop_active_display_tasks()
         
         # Clear last preset to prevent auto-restore from overriding manual text
         self.settings['last_preset'] = None
-        self.save_settings()
+        self._schedule_save_settings()
         
         self.send_text_btn.config(state=tk.DISABLED, text="Sending...")
         
@@ -3088,11 +3566,7 @@ class iPixelController:
                         if sprite_img is None:
                             raise Exception(sprite_err or "Sprite render failed")
 
-                        tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_text_sprite.png')
-                        sprite_img.save(tmp_path, 'PNG')
-                        result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                        if asyncio.iscoroutine(result):
-                            self.run_async(result)
+                        self._send_pil_image(sprite_img, 'ipixel_text_sprite.png')
                     else:
                         text_color_hex = self.text_color.lstrip('#')
                         bg_color_hex = self.bg_color.lstrip('#')
@@ -3106,29 +3580,30 @@ class iPixelController:
                             speed=inverted_speed,
                             rainbow_mode=self.rainbow_var.get()
                         )
+                        # Wait for the write: this job holds the BLE queue until the text is sent
                         if asyncio.iscoroutine(result):
                             self.run_async(result)
                 except Exception as e:
-                    error_msg = str(e)
-                    self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to send text: {error_msg}"))
+                    self._ui(messagebox.showerror, "Error", f"Failed to send text: {e}")
                 finally:
-                    self.root.after(0, lambda: self.send_text_btn.config(state=tk.NORMAL, text="Send Text"))
+                    self._ui(self.send_text_btn.config, state=tk.NORMAL, text="Send Text")
 
-            threading.Thread(target=send_task, daemon=True).start()
+            self._enqueue_ble(send_task)
 
         if self.animation_var.get() == 0:
-            parts = [p.strip() for p in text.replace('|', '\n').splitlines() if p.strip()]
-
-            if self.text_use_sprite_var.get():
-                font = self._get_sprite_font_by_name(self.text_sprite_font_var.get().strip())
-                if not font:
-                    messagebox.showerror("Error", "Sprite font not found")
-                    return
+            parts = self._split_text_parts(text)
 
+            if sprite_font:
+                font = sprite_font
                 try:
-                    sprite = Image.open(font.get('path', '')).convert("RGBA")
+                    sprite_path = self._resolve_asset_path(font.get('path', ''))
+                    mtime = self._sprite_mtime(sprite_path)
+                    if mtime is None:
+                        raise FileNotFoundError(f"Sprite sheet not found: {sprite_path}")
+                    sprite = _load_sprite_sheet(sprite_path, mtime)
                     cols = max(1, int(font.get('cols', 1)))
-                    tile_w = max(1, sprite.width // cols)
+                    order = (font.get('order', '') or '').strip()
+                    tile_w = self._get_sprite_layout(sprite, sprite_path, order, cols)[0]
                 except Exception as e:
                     messagebox.showerror("Error", f"Sprite load failed: {e}")
                     return
@@ -3172,13 +3647,7 @@ class iPixelController:
                     try:
                         self._stop_sprite_scroll()
                         if page['scroll']:
-                            line_img, sprite_err = self._build_sprite_text_line_image(
-                                value_text,
-                                font.get('path', ''),
-                                font.get('order', ''),
-                                font.get('cols', 1),
-                                self.bg_color
-                            )
+                            line_img, sprite_err = self._get_sprite_line_image(value_text, font, self.bg_color)
                             if line_img is None:
                                 raise Exception(sprite_err or "Sprite render failed")
                             if line_img.width <= 64:
@@ -3203,8 +3672,7 @@ class iPixelController:
 
                         self.text_static_timer = self.root.after(next_delay, advance)
                     except Exception as e:
-                        error_msg = str(e)
-                        self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to send text: {error_msg}"))
+                        self._ui(messagebox.showerror, "Error", f"Failed to send text: {e}")
 
                 show_page()
                 return
@@ -3223,6 +3691,10 @@ class iPixelController:
 
         send_text_value(text)
     
+    def _split_text_parts(self, text):
+        """Split text into display parts on '|' and newlines."""
+        return [p.strip() for p in text.replace('|', '\n').splitlines() if p.strip()]
+    
     def load_image(self):
         """Load an image file"""
         filepath = filedialog.askopenfilename(
@@ -3263,7 +3735,7 @@ class iPixelController:
         
         # Clear last preset to prevent auto-restore from overriding manual image
         self.settings['last_preset'] = None
-        self.save_settings()
+        self._schedule_save_settings()
         
         self.send_image_btn.config(state=tk.DISABLED, text="Sending...")
         
@@ -3277,6 +3749,17 @@ class iPixelController:
                 except:
                     pass  # Clear might not be available
                 
+                # Large JPEGs are decoded at a reduced DCT scale that still covers
+                # the 64x16 panel; the client then crops as usual
+                small = None
+                with Image.open(image_path) as im:
+                    if im.format == 'JPEG' and (im.width > 128 or im.height > 32):
+                        im.draft('RGB', (64, 16))
+                        small = im.convert('RGB')
+                if small is not None:
+                    self._send_pil_image(small, 'ipixel_image.png')
+                    return
+                
                 # Send image with save_slot=0 to display immediately
                 # Using 'crop' resize method to fill the entire display
                 result = self.client.send_image(image_path, resize_method='crop', save_slot=0)
@@ -3284,11 +3767,11 @@ class iPixelController:
                     self.run_async(result)
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to send image: {error_msg}"))
+                self._ui(messagebox.showerror, "Error", f"Failed to send image: {error_msg}")
             finally:
-                self.root.after(0, lambda: self.send_image_btn.config(state=tk.NORMAL, text="Send Image"))
+                self._ui(self.send_image_btn.config, state=tk.NORMAL, text="Send Image")
         
-        threading.Thread(target=send_task, daemon=True).start()
+        self._enqueue_ble(send_task)
     
     def update_clock_options(self):
         """Update visibility of clock options based on selected mode"""
@@ -3400,16 +3883,26 @@ class iPixelController:
 
         if added:
             self.settings['sprite_fonts'] = fonts
-            self.save_settings()
+            self._schedule_save_settings()
+        self._rebuild_sprite_font_index()
 
     def _get_sprite_font_names(self):
         return [f.get('name', '') for f in self._get_sprite_fonts() if f.get('name')]
 
+    def _rebuild_sprite_font_index(self):
+        """Rebuild the name -> sprite font lookup (first font wins on duplicate names)"""
+        self._sprite_font_index = {f.get('name'): f for f in reversed(self._get_sprite_fonts())}
+        self._countdown_sprite_font = (None, None)
+
+    def _get_countdown_sprite_font(self):
+        """Sprite font selected for the countdown, resolved again only when the selection changes"""
+        name = self.countdown_sprite_font_var.get().strip()
+        if self._countdown_sprite_font[0] != name:
+            self._countdown_sprite_font = (name, self._get_sprite_font_by_name(name))
+        return self._countdown_sprite_font[1]
+
     def _get_sprite_font_by_name(self, name):
-        for font in self._get_sprite_fonts():
-            if font.get('name') == name:
-                return font
-        return None
+        return self._sprite_font_index.get(name)
 
     def _refresh_sprite_font_dropdowns(self):
         names = self._get_sprite_font_names()
@@ -3466,9 +3959,12 @@ class iPixelController:
             messagebox.showwarning("Duplicate Name", "A sprite font with this name already exists.")
             return
         fonts = self._get_sprite_fonts()
-        fonts.append({'name': name, 'path': path, 'order': order, 'cols': cols})
+        font = {'name': name, 'path': path, 'order': order, 'cols': cols}
+        fonts.append(font)
+        self._prime_sprite_font(font)
         self.settings['sprite_fonts'] = fonts
-        self.save_settings()
+        self._rebuild_sprite_font_index()
+        self._schedule_save_settings()
         self._refresh_sprite_font_listbox()
         self._refresh_sprite_font_dropdowns()
 
@@ -3481,16 +3977,21 @@ class iPixelController:
             messagebox.showwarning("Missing Data", "Please provide a name and sprite sheet path.")
             return
         fonts = self._get_sprite_fonts()
-        updated = False
+        updated = None
         for font in fonts:
             if font.get('name') == name:
                 font.update({'path': path, 'order': order, 'cols': cols})
-                updated = True
+                updated = font
                 break
-        if not updated:
-            fonts.append({'name': name, 'path': path, 'order': order, 'cols': cols})
+        if updated is None:
+            updated = {'name': name, 'path': path, 'order': order, 'cols': cols}
+            fonts.append(updated)
+        self._prime_sprite_font(updated)
+        with self._sprite_cache_lock:
+            self._sprite_line_cache.clear()
         self.settings['sprite_fonts'] = fonts
-        self.save_settings()
+        self._rebuild_sprite_font_index()
+        self._schedule_save_settings()
         self._refresh_sprite_font_listbox()
         self._refresh_sprite_font_dropdowns()
 
@@ -3499,8 +4000,11 @@ class iPixelController:
         if not name:
             return
         fonts = [f for f in self._get_sprite_fonts() if f.get('name') != name]
+        with self._sprite_cache_lock:
+            self._sprite_line_cache.clear()
         self.settings['sprite_fonts'] = fonts
-        self.save_settings()
+        self._rebuild_sprite_font_index()
+        self._schedule_save_settings()
         self._refresh_sprite_font_listbox()
         self._refresh_sprite_font_dropdowns()
 
@@ -3509,33 +4013,33 @@ class iPixelController:
         self.settings['text_use_sprite_font'] = self.text_use_sprite_var.get()
         self.settings['text_sprite_font_name'] = self.text_sprite_font_var.get().strip()
         self.settings['text_static_delay_seconds'] = int(self.text_static_delay_var.get() or 2)
-        self.save_settings()
+        self._schedule_save_settings()
 
     def update_clock_sprite_settings(self):
         """Persist sprite font settings for clock"""
         self.settings['clock_use_time_sprite'] = self.clock_use_time_sprite_var.get()
         self.settings['clock_time_sprite_font_name'] = self.clock_sprite_font_var.get().strip()
-        self.save_settings()
+        self._schedule_save_settings()
 
     def update_countdown_sprite_settings(self):
         """Persist sprite font settings for countdown"""
         self.settings['countdown_use_sprite_font'] = self.countdown_use_sprite_var.get()
         self.settings['countdown_sprite_font_name'] = self.countdown_sprite_font_var.get().strip()
         self.settings['countdown_static_delay_seconds'] = int(self.countdown_static_delay_var.get() or 2)
-        self.save_settings()
+        self._schedule_save_settings()
 
     def update_stock_sprite_settings(self):
         """Persist sprite font settings for stocks"""
         self.settings['stock_use_sprite_font'] = True
         self.settings['stock_sprite_font_name'] = self.stock_sprite_font_var.get().strip()
         self.settings['stock_static_delay_seconds'] = int(self.stock_static_delay_var.get() or 2)
-        self.save_settings()
+        self._schedule_save_settings()
 
     def update_youtube_sprite_settings(self):
         """Persist sprite font settings for YouTube"""
         self.settings['youtube_use_sprite_font'] = self.youtube_use_sprite_var.get()
         self.settings['youtube_sprite_font_name'] = self.youtube_sprite_font_var.get().strip()
-        self.save_settings()
+        self._schedule_save_settings()
 
     def browse_youtube_logo(self):
         filepath = filedialog.askopenfilename(
@@ -3550,7 +4054,7 @@ class iPixelController:
         """Persist YouTube logo settings"""
         self.settings['youtube_show_logo'] = self.youtube_show_logo_var.get()
         self.settings['youtube_logo_path'] = self.youtube_logo_path_var.get().strip()
-        self.save_settings()
+        self._schedule_save_settings()
 
     def _sprite_scroll_interval_ms(self, speed_value):
         try:
@@ -3560,17 +4064,117 @@ class iPixelController:
         return max(20, 220 - speed * 2)
 
     def _resolve_asset_path(self, path_value):
-        if not path_value:
-            return ""
-        path_value = os.path.expanduser(path_value)
-        if os.path.isabs(path_value):
-            return path_value
-        return os.path.normpath(os.path.join(os.path.dirname(__file__), path_value))
-
-    def _build_sprite_text_line_image(self, text, sprite_path, order, cols, bg_color):
-        """Build a single-line image from a sprite sheet without scaling to 64x16."""
+        return _resolve_asset(path_value)
+
+    def _sprite_mtime(self, path):
+        """mtime of a sprite sheet, or None if it is not a file; re-checked at most every 2s."""
+        now = time.monotonic()
+        cached = self._sprite_stat_cache.get(path)
+        if cached is not None and now - cached[0] < 2.0:
+            return cached[1]
+        try:
+            st = os.stat(path)
+            mtime = st.st_mtime if stat.S_ISREG(st.st_mode) else None
+        except OSError:
+            mtime = None
+        with self._sprite_cache_lock:
+            if len(self._sprite_stat_cache) >= 256:
+                # Expired entries would be re-checked anyway; drop them to stay bounded
+                self._sprite_stat_cache = {
+                    k: v for k, v in self._sprite_stat_cache.items() if now - v[0] < 2.0
+                }
+            self._sprite_stat_cache[path] = (now, mtime)
+        return mtime
+
+    def _asset_exists(self, path):
+        """Whether an asset path is an existing file, via the same throttled stat cache."""
+        return bool(path) and self._sprite_mtime(path) is not None
+
+    def _get_sprite_layout(self, sprite, sprite_path, order, cols):
+        """Return (tile_w, tile_h, glyph boxes) for a sprite sheet, computed once."""
+        key = (sprite_path, order, cols, sprite.size)
+        layout = self._sprite_layouts.get(key)
+        if layout is None:
+            rows = max(1, math.ceil(len(order) / cols))
+            tile_w = max(1, sprite.width // cols)
+            tile_h = max(1, sprite.height // rows)
+
+            glyph_map = {}
+            for idx, ch in enumerate(order):
+                left = (idx % cols) * tile_w
+                upper = (idx // cols) * tile_h
+                right = left + tile_w
+                lower = upper + tile_h
+                if right <= sprite.width and lower <= sprite.height:
+                    glyph_map[ch] = (left, upper, right, lower)
+
+            layout = (tile_w, tile_h, glyph_map)
+            self._sprite_layouts[key] = layout
+        return layout
+
+    def _prime_sprite_font(self, font):
+        """Precompute the glyph layout for a sprite font when it is added or updated."""
+        self._validate_sprite_font(font)
+
+    def _validate_sprite_font(self, font):
+        """Return None if the sprite font loads, else an error message; cached per sheet version."""
+        sprite_path = self._resolve_asset_path(font.get('path', ''))
+        mtime = self._sprite_mtime(sprite_path)
+        if mtime is None:
+            return "Sprite sheet not found"
+        order = (font.get('order', '') or '').strip()
+        try:
+            cols = max(1, int(font.get('cols', 1)))
+        except (TypeError, ValueError):
+            return "Invalid column count"
+
+        key = (sprite_path, mtime, order, cols)
+        cached = self._sprite_font_errors.get(key, False)
+        if cached is not False:
+            return cached
+        try:
+            sprite = _load_sprite_sheet(sprite_path, mtime)
+            self._get_sprite_layout(sprite, sprite_path, order, cols)
+            err = None
+        except Exception as e:
+            err = str(e)
+        with self._sprite_cache_lock:
+            if len(self._sprite_font_errors) >= 64:
+                # Results for older sheet versions pile up as sheets are edited
+                self._sprite_font_errors.clear()
+            self._sprite_font_errors[key] = err
+        return err
+
+    def _build_sprite_glyph_lut(self, sprite, glyph_map, tile_w, tile_h):
+        """Return (char -> glyph dict, blank tile, stacked tiles, Latin-1 byte -> tile index)."""
+        # Convert per glyph so palette/grayscale sheets never expand to RGBA in full
+        lut = {ch: np.asarray(sprite.crop(box).convert("RGBA")) for ch, box in glyph_map.items()}
+        for ch in glyph_map:
+            lower = ch.lower()
+            if lower != ch and lower not in glyph_map and lower.upper() == ch:
+                lut[lower] = lut[ch]
+        blank = np.zeros((tile_h, tile_w, 4), dtype=np.uint8)
+
+        # Stacked tiles (blank last) plus a byte index for Latin-1 text, using
+        # the same direct / uppercase / blank resolution as the dict
+        glyph_chars = list(glyph_map)
+        tiles = np.stack([lut[ch] for ch in glyph_chars] + [blank])
+        slots = {ch: i for i, ch in enumerate(glyph_chars)}
+        byte_index = np.full(256, len(glyph_chars), dtype=np.intp)
+        for code in range(256):
+            ch = chr(code)
+            slot = slots.get(ch)
+            if slot is None:
+                slot = slots.get(ch.upper())
+            if slot is not None:
+                byte_index[code] = slot
+        return lut, blank, tiles, byte_index
+
+    def _compose_sprite_line(self, text, sprite_path, order, cols, bg_color, mode="RGBA"):
+        """Compose text from a sprite sheet into an RGBA (or RGB) strip at native tile size."""
         sprite_path = self._resolve_asset_path(sprite_path)
-        if not sprite_path or not os.path.isfile(sprite_path):
+        mtime = self._sprite_mtime(sprite_path)
+        if mtime is None:
             return None, "Sprite sheet not found"
 
         order = (order or "").strip()
@@ -3584,47 +4188,163 @@ class iPixelController:
         cols = max(1, cols)
 
         try:
-            sprite = Image.open(sprite_path).convert("RGBA")
+            sprite = _load_sprite_sheet(sprite_path, mtime)
         except Exception as e:
             return None, f"Sprite load failed: {e}"
 
-        rows = max(1, math.ceil(len(order) / cols))
-        tile_w = max(1, sprite.width // cols)
-        tile_h = max(1, sprite.height // rows)
-
-        glyphs = {}
-        for idx, ch in enumerate(order):
-            row = idx // cols
-            col = idx % cols
-            left = col * tile_w
-            upper = row * tile_h
-            right = left + tile_w
-            lower = upper + tile_h
-            if right <= sprite.width and lower <= sprite.height:
-                glyphs[ch] = sprite.crop((left, upper, right, lower))
-
-        if not glyphs:
+        tile_w, tile_h, glyph_map = self._get_sprite_layout(sprite, sprite_path, order, cols)
+        if not glyph_map:
             return None, "No glyphs found in sprite sheet"
 
-        chars = list(text)
-        total_w = tile_w * len(chars)
-        base = Image.new("RGBA", (max(1, total_w), tile_h), bg_color)
-
-        x = 0
-        for ch in chars:
-            glyph = glyphs.get(ch)
-            if glyph is None:
-                glyph = glyphs.get(ch.upper())
-            if glyph is None and ch == " ":
-                x += tile_w
-                continue
-            if glyph is None:
-                x += tile_w
-                continue
-            base.paste(glyph, (x, 0), glyph)
-            x += tile_w
+        # Glyph table is built once per sheet version
+        glyph_key = (sprite_path, order, cols)
+        cached = self._sprite_glyph_cache.get(glyph_key)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime,) + self._build_sprite_glyph_lut(sprite, glyph_map, tile_w, tile_h)
+            self._sprite_glyph_cache[glyph_key] = cached
+        _, lut, blank, stacked, byte_index = cached
 
-        return base.convert("RGB"), None
+        total_w = tile_w * len(text)
+        base = Image.new(mode, (max(1, total_w), tile_h), bg_color)
+        if not text:
+            return base, None
+
+        try:
+            codes = np.frombuffer(text.encode('latin-1'), dtype=np.uint8)
+        except UnicodeEncodeError:
+            codes = None
+        if codes is not None and _blend_sprite_tiles is not None:
+            # Compiled gather + blend straight into the output buffer
+            out = np.empty((tile_h, total_w, len(mode)), dtype=np.uint8)
+            bg = np.asarray(base.getpixel((0, 0)), dtype=np.uint8)
+            _blend_sprite_tiles(stacked, byte_index[codes], bg, out)
+            return Image.fromarray(out, mode), None
+        if codes is not None:
+            # Gather all tiles in one fancy index and lay them side by side
+            strip = stacked[byte_index[codes]].transpose(1, 0, 2, 3).reshape(tile_h, total_w, 4)
+        else:
+            # Characters outside the table resolve once: uppercase glyph, else a
+            # transparent tile that leaves the background
+            for ch in set(text).difference(lut):
+                upper = ch.upper()
+                lut[ch] = lut[upper] if upper in glyph_map else blank
+            strip = np.concatenate([lut[ch] for ch in text], axis=1)
+
+        # One alpha blend over the whole strip, rounded like PIL's paste with a mask
+        strip = strip.astype(np.uint32)
+        alpha = strip[..., 3:4]
+        blended = np.asarray(base, dtype=np.uint32) * (255 - alpha) + strip[..., :len(mode)] * alpha + 128
+        blended = ((blended >> 8) + blended) >> 8
+        return Image.fromarray(blended.astype(np.uint8), mode), None
+
+    def _build_sprite_text_line_image(self, text, sprite_path, order, cols, bg_color):
+        """Build a single-line image from a sprite sheet without scaling to 64x16."""
+        # Nothing is composited on top of a line image, so skip the alpha plane
+        return self._compose_sprite_line(text, sprite_path, order, cols, bg_color, mode="RGB")
+
+    def _get_sprite_line_image(self, text, font, bg_color):
+        """Sprite line image for a font, memoized across repeated sends."""
+        path = font.get('path', '')
+        order = font.get('order', '')
+        cols = font.get('cols', 1)
+        resolved = self._resolve_asset_path(path)
+        mtime = self._sprite_mtime(resolved)
+        if mtime is None:
+            return self._build_sprite_text_line_image(text, path, order, cols, bg_color)
+        key = (resolved, mtime, order, cols, bg_color, text)
+
+        with self._sprite_cache_lock:
+            line_img = self._sprite_line_cache.get(key)
+            if line_img is not None:
+                self._sprite_line_cache.move_to_end(key)
+                return line_img, None
+
+        line_img, err = self._build_sprite_text_line_image(text, path, order, cols, bg_color)
+        if line_img is not None:
+            with self._sprite_cache_lock:
+                self._sprite_line_cache[key] = line_img
+                if len(self._sprite_line_cache) > 64:
+                    self._sprite_line_cache.popitem(last=False)
+        return line_img, err
+
+    def _get_countdown_sprite_png(self, text, font, bg_color):
+        """PNG bytes of a 64x16 countdown sprite frame, memoized while the countdown runs."""
+        key = (text, font.get('path', ''), font.get('order', ''), font.get('cols', 1), bg_color)
+        with self._sprite_cache_lock:
+            png = self._countdown_sprite_cache.get(key)
+            if png is not None:
+                self._countdown_sprite_cache.move_to_end(key)
+                return png, None
+
+        sprite_img, err = self._build_sprite_text_image(text, key[1], key[2], key[3], bg_color)
+        if sprite_img is None:
+            return None, err
+        buf = BytesIO()
+        sprite_img.save(buf, 'PNG', compress_level=1)
+        png = buf.getvalue()
+        with self._sprite_cache_lock:
+            self._countdown_sprite_cache[key] = png
+            if len(self._countdown_sprite_cache) > 64:
+                self._countdown_sprite_cache.popitem(last=False)
+        return png, None
+
+    def _cycle_countdown_sprite_frames(self, frames, font, bg_color, delay_ms, run):
+        """Show static countdown sprite frames, cycling every delay_ms; each frame is encoded once."""
+        # Render every frame up front so errors surface here and ticks only send
+        pngs = []
+        for value_text in frames:
+            png, sprite_err = self._get_countdown_sprite_png(value_text, font, bg_color)
+            if png is None:
+                raise Exception(sprite_err or "Sprite render failed")
+            pngs.append(png)
+        if len(pngs) == 1:
+            self._send_png_bytes(pngs[0], 'ipixel_countdown_sprite.png')
+            return
+
+        state = {'index': 0}
+
+        def tick():
+            png = pngs[state['index']]
+            self._enqueue_ble(lambda: self._clock_run_current(run) and self._send_png_bytes(png, 'ipixel_countdown_sprite.png'))
+            state['index'] = (state['index'] + 1) % len(pngs)
+            self.countdown_static_timer = self.root.after(delay_ms, tick)
+
+        tick()
+
+    def _send_pil_image(self, img, name='ipixel_frame.png'):
+        """Send a PIL image, in memory when the client accepts file objects."""
+        buf = BytesIO()
+        img.save(buf, 'PNG', compress_level=1)
+        self._send_png_bytes(buf.getvalue(), name)
+
+    def _send_png_bytes(self, data, name='ipixel_frame.png'):
+        """Send already-encoded PNG bytes, in memory when the client accepts file objects."""
+        buf = BytesIO(data)
+        buf.name = name
+
+        if self._client_accepts_buffers is not False:
+            try:
+                result = self.client.send_image(buf, resize_method='crop', save_slot=0)
+                if asyncio.iscoroutine(result):
+                    self.run_async(result)
+            except Exception:
+                # Once a buffer send has worked, failures are real send errors
+                if self._client_accepts_buffers:
+                    raise
+            else:
+                self._client_accepts_buffers = True
+                return
+
+        # First send failed in memory (the client may only take paths, and can
+        # fail in many ways on a file object) or is known path-only: use a temp file
+        tmp_path = _temp_path(name)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
+        if asyncio.iscoroutine(result):
+            self.run_async(result)
+        # Only settle on path-only once the file send has worked where the buffer did not
+        self._client_accepts_buffers = False
 
     def _stop_sprite_scroll(self):
         self.sprite_scroll_running = False
@@ -3632,6 +4352,23 @@ class iPixelController:
             self.root.after_cancel(self.sprite_scroll_timer)
             self.sprite_scroll_timer = None
 
+    def _pad_scroll_line(self, line_img, bg_color, end_pad, x):
+        """Paste a scroll line into a reused buffer that has end_pad columns of background."""
+        key = (line_img.mode, line_img.width + end_pad, line_img.height, bg_color, x)
+        with self._sprite_cache_lock:
+            padded = self._pad_buffer_cache.get(key)
+            if padded is None:
+                padded = Image.new(line_img.mode, key[1:3], bg_color)
+                self._pad_buffer_cache[key] = padded
+                if len(self._pad_buffer_cache) > 4:
+                    self._pad_buffer_cache.popitem(last=False)
+            else:
+                self._pad_buffer_cache.move_to_end(key)
+            # The padding columns sit at the same place for this key, so they are
+            # still background; pasting the line overwrites everything else
+            padded.paste(line_img, (x, 0))
+        return padded
+
     def _start_sprite_scroll(self, line_img, bg_color, speed, direction="left"):
         self._stop_sprite_scroll()
         self.sprite_scroll_running = True
@@ -3639,24 +4376,17 @@ class iPixelController:
         end_pad = 8
         if end_pad > 0 and line_img.width > 0:
             if direction == "left":
-                padded = Image.new(line_img.mode, (line_img.width + end_pad, line_img.height), bg_color)
-                padded.paste(line_img, (0, 0))
-                line_img = padded
+                line_img = self._pad_scroll_line(line_img, bg_color, end_pad, 0)
             elif direction == "right":
-                padded = Image.new(line_img.mode, (line_img.width + end_pad, line_img.height), bg_color)
-                padded.paste(line_img, (end_pad, 0))
-                line_img = padded
+                line_img = self._pad_scroll_line(line_img, bg_color, end_pad, end_pad)
 
         if line_img.width <= 64:
             frame = line_img
             if line_img.height != 16:
                 frame = line_img.resize((64, 16), Image.NEAREST)
-            tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_sprite_scroll.png')
-            frame.save(tmp_path, 'PNG')
-            result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-            if asyncio.iscoroutine(result):
-                self.run_async(result)
+            # Fits on the panel: one queued frame, no scroll timer
             self._stop_sprite_scroll()
+            self._enqueue_ble(lambda: self._send_pil_image(frame, 'ipixel_sprite_scroll.png'))
             return
 
         max_offset = line_img.width - 64
@@ -3665,21 +4395,41 @@ class iPixelController:
         interval = self._sprite_scroll_interval_ms(speed)
         pause_ms = 3000
 
+        # Resize the whole strip once; each tick then just slices a 64px window
+        if line_img.height != 16:
+            line_img = line_img.resize((line_img.width, 16), Image.NEAREST)
+        strip = np.asarray(line_img)
+        sending = threading.Event()
+        # PNG bytes per offset, encoded on first use and replayed on later passes
+        encoded = [None] * (max_offset + 1)
+        encode_buf = BytesIO()  # One encoder buffer per scroll; frames are encoded one at a time
+
         def tick():
             if not self.sprite_scroll_running:
                 return
 
-            try:
-                crop = line_img.crop((offset[0], 0, offset[0] + 64, line_img.height))
-                if line_img.height != 16:
-                    crop = crop.resize((64, 16), Image.NEAREST)
-                tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_sprite_scroll.png')
-                crop.save(tmp_path, 'PNG')
-                result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                if asyncio.iscoroutine(result):
-                    self.run_async(result)
-            except Exception:
-                pass
+            # Send through the BLE queue; skip this frame if the last one is still in flight
+            if not sending.is_set():
+                def send_frame():
+                    try:
+                        if self.sprite_scroll_running:
+                            # Send the newest position when the job runs, not the one
+                            # current when it was queued, so a slow link lags less
+                            frame_offset = offset[0]
+                            data = encoded[frame_offset]
+                            if data is None:
+                                encode_buf.seek(0)
+                                encode_buf.truncate()
+                                Image.fromarray(strip[:, frame_offset:frame_offset + 64]).save(encode_buf, 'PNG', compress_level=1)
+                                data = encoded[frame_offset] = encode_buf.getvalue()
+                            self._send_png_bytes(data, 'ipixel_sprite_scroll.png')
+                    except Exception:
+                        pass
+                    finally:
+                        sending.clear()
+
+                sending.set()
+                self._enqueue_ble(send_frame)
 
             next_offset = offset[0] + step
             wrapped = False
@@ -3699,67 +4449,17 @@ class iPixelController:
 
     def _build_sprite_text_image(self, text, sprite_path, order, cols, bg_color):
         """Build a 64x16 image from a sprite sheet and text."""
-        sprite_path = self._resolve_asset_path(sprite_path)
-        if not sprite_path or not os.path.isfile(sprite_path):
-            return None, "Sprite sheet not found"
-
-        order = (order or "").strip()
-        if not order:
-            return None, "Glyph order is empty"
-
-        try:
-            cols = int(cols)
-        except Exception:
-            cols = 1
-        cols = max(1, cols)
-
-        try:
-            sprite = Image.open(sprite_path).convert("RGBA")
-        except Exception as e:
-            return None, f"Sprite load failed: {e}"
-
-        rows = max(1, math.ceil(len(order) / cols))
-        tile_w = max(1, sprite.width // cols)
-        tile_h = max(1, sprite.height // rows)
-
-        glyphs = {}
-        for idx, ch in enumerate(order):
-            row = idx // cols
-            col = idx % cols
-            left = col * tile_w
-            upper = row * tile_h
-            right = left + tile_w
-            lower = upper + tile_h
-            if right <= sprite.width and lower <= sprite.height:
-                glyphs[ch] = sprite.crop((left, upper, right, lower))
-
-        if not glyphs:
-            return None, "No glyphs found in sprite sheet"
-
-        chars = list(text)
-        total_w = tile_w * len(chars)
-        base = Image.new("RGBA", (max(1, total_w), tile_h), bg_color)
-
-        x = 0
-        for ch in chars:
-            glyph = glyphs.get(ch)
-            if glyph is None:
-                glyph = glyphs.get(ch.upper())
-            if glyph is None and ch == " ":
-                x += tile_w
-                continue
-            if glyph is None:
-                x += tile_w
-                continue
-            base.paste(glyph, (x, 0), glyph)
-            x += tile_w
+        base, err = self._compose_sprite_line(text, sprite_path, order, cols, bg_color)
+        if base is None:
+            return None, err
 
         target_w, target_h = 64, 16
         if base.size != (target_w, target_h):
             scale = min(target_w / base.width, target_h / base.height)
             new_w = max(1, int(base.width * scale))
             new_h = max(1, int(base.height * scale))
-            resized = base.resize((new_w, new_h), Image.NEAREST)
+            # Short text on a 16px sheet only needs centering, not resampling
+            resized = base if (new_w, new_h) == base.size else base.resize((new_w, new_h), Image.NEAREST)
             canvas = Image.new("RGBA", (target_w, target_h), bg_color)
             offset_x = (target_w - new_w) // 2
             offset_y = (target_h - new_h) // 2
@@ -3774,13 +4474,17 @@ class iPixelController:
         font = self._get_sprite_font_by_name(font_name)
         if not font:
             return None, "Sprite font not found"
-        return self._build_sprite_text_image(
-            time_text,
-            font.get('path', ''),
-            font.get('order', '0123456789:'),
-            font.get('cols', 1),
-            self.clock_bg_color
-        )
+        path = font.get('path', '')
+        order = font.get('order', '0123456789:')
+        cols = font.get('cols', 1)
+        # HH:MM only changes once a minute; reuse the last render until it does
+        key = (time_text, path, self._sprite_mtime(self._resolve_asset_path(path)), order, cols, self.clock_bg_color)
+        if self._last_time_render[0] == key:
+            return self._last_time_render[1], None
+        img, err = self._build_sprite_text_image(time_text, path, order, cols, self.clock_bg_color)
+        if img is not None:
+            self._last_time_render = (key, img)
+        return img, err
 
     
     def choose_countdown_color(self):
@@ -3788,6 +4492,7 @@ class iPixelController:
         color = colorchooser.askcolor(title="Choose Countdown Text Color", initialcolor=self.countdown_color)
         if color[1]:
             self.countdown_color = color[1]
+            self._countdown_color_hex = self.countdown_color.lstrip('#')
             self.countdown_color_canvas.config(bg=self.countdown_color)
     
     def choose_countdown_bg_color(self):
@@ -3795,6 +4500,7 @@ class iPixelController:
         color = colorchooser.askcolor(title="Choose Countdown Background Color", initialcolor=self.countdown_bg_color)
         if color[1]:
             self.countdown_bg_color = color[1]
+            self._countdown_bg_color_hex = self.countdown_bg_color.lstrip('#')
             self.countdown_bg_color_canvas.config(bg=self.countdown_bg_color)
     
     def show_clock(self):
@@ -3805,7 +4511,8 @@ class iPixelController:
         
         # Clear last preset to prevent auto-restore from overriding manual clock
         self.settings['last_preset'] = None
-        self.save_settings()
+        self._current_preset_name = None
+        self._schedule_save_settings()
         
         mode = self.clock_mode_var.get()
         
@@ -3820,11 +4527,11 @@ class iPixelController:
                         self.run_async(result)
                 except Exception as e:
                     error_msg = str(e)
-                    self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to show clock: {error_msg}"))
+                    self._ui(messagebox.showerror, "Error", f"Failed to show clock: {error_msg}")
                 finally:
-                    self.root.after(0, lambda: self.send_clock_btn.config(state=tk.NORMAL, text="Show Clock"))
+                    self._ui(self.send_clock_btn.config, state=tk.NORMAL, text="Show Clock")
             
-            threading.Thread(target=send_task, daemon=True).start()
+            self._enqueue_ble(send_task)
         elif mode == "custom":
             # Start custom live clock
             if hasattr(self, 'clock_image_status_var'):
@@ -3836,8 +4543,6 @@ class iPixelController:
     
     def start_live_clock(self):
         """Start a live updating custom clock"""
-        import time
-        
         # Stop any existing clock
         self.stop_live_clock()
         self._stop_sprite_scroll()
@@ -3853,7 +4558,8 @@ class iPixelController:
         self.stop_clock_btn.config(state=tk.NORMAL)
         
         # Mark clock as running
-        self.clock_running = True
+        run = self._begin_clock_run()
+        deadline = [time.monotonic()]  # When the current tick was due
         
         def update_time():
             if not self.clock_running:
@@ -3865,36 +4571,28 @@ class iPixelController:
                 
                 # Determine animation
                 animation = self.clock_animation_var.get()
-                anim_map = {
-                    "static": 0,
-                    "scroll_left": 1,
-                    "flash": 4
-                }
+                use_sprite = self.clock_use_time_sprite_var.get()
                 
                 # Send text with current time
                 def send_task():
                     try:
-                        self.root.after(0, lambda t=current_time: self.clock_image_status_var.set(f"Clock tick: {t}"))
+                        self._ui(self.clock_image_status_var.set, f"Clock tick: {current_time}")
 
                         # Optional: use sprite sheet
-                        if self.clock_use_time_sprite_var.get():
+                        if use_sprite:
                             sprite_img, sprite_err = self._build_time_sprite_image(current_time)
                             if sprite_img is not None:
-                                tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_clock_sprite.png')
-                                sprite_img.save(tmp_path, 'PNG')
-                                self.root.after(0, lambda p=tmp_path: self.clock_image_status_var.set(f"Sprite image: {os.path.basename(p)}"))
+                                self._ui(self.clock_image_status_var.set, "Sprite image: ipixel_clock_sprite.png")
                                 try:
-                                    result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                                    if asyncio.iscoroutine(result):
-                                        self.run_async(result)
+                                    self._send_pil_image(sprite_img, 'ipixel_clock_sprite.png')
                                     return
                                 except Exception as e:
-                                    self.root.after(0, lambda: self.clock_image_status_var.set(f"Sprite send failed: {e}"))
+                                    self._ui(self.clock_image_status_var.set, f"Sprite send failed: {e}")
                             else:
-                                self.root.after(0, lambda: self.clock_image_status_var.set(f"Sprite error: {sprite_err} (fallback to images/text)"))
+                                self._ui(self.clock_image_status_var.set, f"Sprite error: {sprite_err} (fallback to images/text)")
 
-                        if not self.clock_use_time_sprite_var.get():
-                            self.root.after(0, lambda: self.clock_image_status_var.set("Sprite sheet disabled"))
+                        if not use_sprite:
+                            self._ui(self.clock_image_status_var.set, "Sprite sheet disabled")
 
                         # Remove # from hex colors
                         color_hex = self.clock_color.lstrip('#')
@@ -3905,7 +4603,7 @@ class iPixelController:
                             char_height=16,
                             color=color_hex,
                             bg_color=bg_color_hex,
-                            animation=anim_map.get(animation, 0),
+                            animation=self._ANIMATION_CODES.get(animation, 0),
                             speed=50
                         )
 
@@ -3913,15 +4611,26 @@ class iPixelController:
                             self.run_async(result)
                     except Exception as e:
                         error_msg = str(e)
-                        self.root.after(0, lambda: messagebox.showerror("Error", f"Clock update failed: {error_msg}"))
+                        self._ui(messagebox.showerror, "Error", f"Clock update failed: {error_msg}")
                         self.root.after(0, self.stop_live_clock)
                 
-                threading.Thread(target=send_task, daemon=True).start()
+                # A static clock already showing this time needs no re-render or resend
+                # (e.g. %H:%M polled every second); flash/scroll are refreshed every tick
+                payload = (current_time, animation, use_sprite,
+                           self.clock_sprite_font_var.get().strip() if use_sprite else None,
+                           self.clock_color, self.clock_bg_color)
+                unchanged = animation == "static" and payload == self._last_clock_payload
                 
-                # Schedule next update
+                # Skip this tick if the previous one has not reached the panel yet
+                if not unchanged and not self._clock_send_inflight.is_set():
+                    self._last_clock_payload = payload
+                    self._clock_send_inflight.set()
+                    self._enqueue_ble(self._clock_job(send_task, run))
+                
+                # Schedule next update against the deadline so tick overhead does not drift
                 if self.clock_running:
-                    interval = self.clock_update_interval_var.get() * 1000  # Convert to milliseconds
-                    self.clock_timer = self.root.after(interval, update_time)
+                    delay = self._advance_clock_deadline(deadline, self.clock_update_interval_var.get())
+                    self.clock_timer = self.root.after(delay, update_time)
             except Exception as e:
                 messagebox.showerror("Error", f"Clock error: {str(e)}")
                 self.stop_live_clock()
@@ -3929,9 +4638,43 @@ class iPixelController:
         # Start the update loop
         update_time()
     
+    def _advance_clock_deadline(self, deadline, interval):
+        """Move a [monotonic deadline] on by interval seconds; return the ms left until it"""
+        now = time.monotonic()
+        deadline[0] += interval
+        if deadline[0] < now:
+            # Fell behind (e.g. the UI was blocked); re-anchor instead of bursting
+            deadline[0] = now
+        return int((deadline[0] - now) * 1000)
+    
+    def _begin_clock_run(self):
+        """Mark a clock/countdown as running; returns its run token, making older queued ticks stale"""
+        self._clock_run += 1
+        self._clock_send_inflight.clear()
+        self.clock_running = True
+        return self._clock_run
+    
+    def _clock_run_current(self, run):
+        """Whether the clock/countdown that queued a send with this token is still running"""
+        return self.clock_running and self._clock_run == run
+    
+    def _clock_job(self, send_task, run):
+        """Wrap a clock/countdown tick so it is dropped once its run stops or is replaced"""
+        def job():
+            try:
+                if self._clock_run_current(run):
+                    send_task()
+            finally:
+                # A newer run manages its own in-flight flag
+                if self._clock_run == run:
+                    self._clock_send_inflight.clear()
+        return job
+    
     def stop_live_clock(self):
         """Stop the live clock updates"""
         self.clock_running = False
+        self._clock_run += 1
+        self._clock_send_inflight.clear()
         
         if self.clock_timer:
             self.root.after_cancel(self.clock_timer)
@@ -3942,6 +4685,10 @@ class iPixelController:
             self.countdown_static_timer = None
 
         self._stop_sprite_scroll()
+        with self._sprite_cache_lock:
+            self._countdown_sprite_cache.clear()
+        self._last_countdown_payload = None
+        self._last_clock_payload = None
         
         self.send_clock_btn.config(state=tk.NORMAL)
         self.stop_clock_btn.config(state=tk.DISABLED)
@@ -3956,6 +4703,8 @@ class iPixelController:
             self.stock_static_timer = None
 
     def _stop_active_display_tasks(self):
+        self._current_preset_name = None
+
         if hasattr(self, 'clock_running') and self.clock_running:
             self.stop_live_clock()
 
@@ -3964,9 +4713,7 @@ class iPixelController:
 
         self._stop_sprite_scroll()
 
-        if self.text_static_timer:
-            self.root.after_cancel(self.text_static_timer)
-            self.text_static_timer = None
+        self._cancel_text_cycle()
 
         if self.countdown_static_timer:
             self.root.after_cancel(self.countdown_static_timer)
@@ -3997,7 +4744,7 @@ class iPixelController:
         self.stop_clock_btn.config(state=tk.NORMAL)
         
         # Mark clock as running
-        self.clock_running = True
+        run = self._begin_clock_run()
         
         # Get target date/time
         try:
@@ -4013,12 +4760,16 @@ class iPixelController:
             self.stop_live_clock()
             return
         
+        # Ticks compare plain epoch seconds instead of building datetimes
+        target_epoch = target_datetime.timestamp()
+        
         def update_countdown():
             if not self.clock_running:
                 return
             
             try:
-                now = datetime.now()
+                remaining = target_epoch - time.time()
+                passed = remaining <= 0
                 
                 # Format based on selection
                 format_choice = self.countdown_format_var.get()
@@ -4026,189 +4777,135 @@ class iPixelController:
                 event_name = self.countdown_event_var.get()
 
                 # Check if event has passed
-                if now >= target_datetime:
+                if passed:
                     if format_choice == "with_name":
                         countdown_text = f"{event_name}: NOW!"
                     else:
                         countdown_text = "NOW!"
                 else:
                     # Calculate time difference
-                    delta = target_datetime - now
-                    
-                    days = delta.days
-                    hours, remainder = divmod(delta.seconds, 3600)
+                    days, remainder = divmod(int(remaining), 86400)
+                    hours, remainder = divmod(remainder, 3600)
                     minutes, seconds = divmod(remainder, 60)
                     
-                    if format_choice == "days_hours_mins":
-                        countdown_text = f"{days}d {hours}h {minutes}m"
-                    elif format_choice == "days_hours":
-                        countdown_text = f"{days}d {hours}h"
-                    elif format_choice == "hours_mins":
-                        total_hours = days * 24 + hours
-                        countdown_text = f"{total_hours}h {minutes}m"
-                    elif format_choice == "days_only":
-                        countdown_text = f"{days} days"
-                    elif format_choice == "with_name":
-                        countdown_text = f"{event_name}: {days}d {hours}h {minutes}m"
-                    else:
-                        countdown_text = f"{days}d {hours}h {minutes}m"
-
-                def _build_countdown_frames():
-                    if now >= target_datetime:
-                        if format_choice == "with_name":
-                            return [event_name.strip() or "Event", "NOW!"]
-                        return ["NOW!"]
+                    formatter = self._COUNTDOWN_FORMATTERS.get(
+                        format_choice, self._COUNTDOWN_FORMATTERS["days_hours_mins"]
+                    )
+                    countdown_text = formatter(days, hours, minutes, event_name)
 
-                    if format_choice == "with_name":
-                        return [
-                            event_name.strip() or "Event",
-                            f"{days}d",
-                            f"{hours}h {minutes}m"
-                        ]
-                    if format_choice == "days_hours_mins":
-                        return [f"{days}d", f"{hours}h {minutes}m"]
-                    if format_choice == "days_hours":
-                        return [f"{days}d", f"{hours}h"]
-                    if format_choice == "hours_mins":
-                        total_hours = days * 24 + hours
-                        return [f"{total_hours}h", f"{minutes}m"]
-                    if format_choice == "days_only":
-                        return [f"{days} days"]
-                    return [f"{days}d", f"{hours}h {minutes}m"]
-                
                 # Determine animation
                 animation = self.countdown_animation_var.get()
-                anim_map = {
-                    "static": 0,
-                    "scroll_left": 1,
-                    "flash": 4
-                }
                 if animation != "static" and self.countdown_static_timer:
                     self.root.after_cancel(self.countdown_static_timer)
                     self.countdown_static_timer = None
                 if animation != "scroll_left":
                     self._stop_sprite_scroll()
                 
+                # Resolve the sprite font and read the Tk settings here on the Tk
+                # thread, once per update; the send and its frame cycle reuse them
+                use_sprite = self.countdown_use_sprite_var.get()
+                font = self._get_countdown_sprite_font() if use_sprite else None
+                bg_color = self.countdown_bg_color
+                color_hex = self._countdown_color_hex
+                bg_color_hex = self._countdown_bg_color_hex
+                speed = self.countdown_speed_var.get()
+                # Invert speed: 1=slowest (100), 100=fastest (1)
+                inverted_speed = 101 - speed
+                static_delay = self.countdown_static_delay_var.get()
+                delay_ms = max(1, int(static_delay or 2)) * 1000
+                # Only the static animation cycles through frames
+                if animation == "static":
+                    if passed:
+                        frames_key = (format_choice, None, None, None, event_name)
+                    else:
+                        frames_key = (format_choice, days, hours, minutes, event_name)
+                    frames = self._get_countdown_frames(frames_key)
+                else:
+                    frames = None
+                
                 # Send text with countdown
                 def send_task():
                     try:
-                        if self.countdown_use_sprite_var.get():
-                            font = self._get_sprite_font_by_name(self.countdown_sprite_font_var.get().strip())
+                        if use_sprite:
                             if not font:
                                 raise Exception("Sprite font not found")
                             if animation == "scroll_left":
-                                line_img, sprite_err = self._build_sprite_text_line_image(
-                                    countdown_text,
-                                    font.get('path', ''),
-                                    font.get('order', ''),
-                                    font.get('cols', 1),
-                                    self.countdown_bg_color
+                                line_img, sprite_err = self._get_sprite_line_image(
+                                    countdown_text, font, bg_color
                                 )
                                 if line_img is None:
                                     raise Exception(sprite_err or "Sprite render failed")
-                                self._start_sprite_scroll(line_img, self.countdown_bg_color, self.countdown_speed_var.get(), direction="left")
+                                self._start_sprite_scroll(line_img, bg_color, speed, direction="left")
+                                return
+                            elif animation == "static":
+                                self._cycle_countdown_sprite_frames(frames, font, bg_color, delay_ms, run)
                                 return
                             else:
-                                def send_value(value_text):
-                                    sprite_img, sprite_err = self._build_sprite_text_image(
-                                        value_text,
-                                        font.get('path', ''),
-                                        font.get('order', ''),
-                                        font.get('cols', 1),
-                                        self.countdown_bg_color
-                                    )
-                                    if sprite_img is None:
-                                        raise Exception(sprite_err or "Sprite render failed")
-                                    tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_countdown_sprite.png')
-                                    sprite_img.save(tmp_path, 'PNG')
-                                    result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                                    if asyncio.iscoroutine(result):
-                                        self.run_async(result)
-
-                                if animation == "static":
-                                    delay_ms = max(1, int(self.countdown_static_delay_var.get() or 2)) * 1000
-                                    frames = _build_countdown_frames()
-                                    if len(frames) > 1:
-                                        state = {'index': 0}
-
-                                        def tick():
-                                            send_value(frames[state['index']])
-                                            state['index'] = (state['index'] + 1) % len(frames)
-                                            self.countdown_static_timer = self.root.after(delay_ms, tick)
-
-                                        tick()
-                                    else:
-                                        send_value(frames[0])
-                                    return
-                                send_value(countdown_text)
+                                png, sprite_err = self._get_countdown_sprite_png(
+                                    countdown_text, font, bg_color
+                                )
+                                if png is None:
+                                    raise Exception(sprite_err or "Sprite render failed")
+                                self._send_png_bytes(png, 'ipixel_countdown_sprite.png')
                         else:
+                            def send_plain(value_text, anim):
+                                result = self.client.send_text(
+                                    text=value_text,
+                                    char_height=16,
+                                    color=color_hex,
+                                    bg_color=bg_color_hex,
+                                    animation=anim,
+                                    speed=inverted_speed
+                                )
+                                if asyncio.iscoroutine(result):
+                                    self.run_async(result)
+
                             if animation == "static":
-                                delay_ms = max(1, int(self.countdown_static_delay_var.get() or 2)) * 1000
-                                frames = _build_countdown_frames()
                                 if len(frames) > 1:
                                     state = {'index': 0}
 
                                     def tick():
-                                        color_hex = self.countdown_color.lstrip('#')
-                                        bg_color_hex = self.countdown_bg_color.lstrip('#')
-                                        inverted_speed = 101 - self.countdown_speed_var.get()
-                                        result = self.client.send_text(
-                                            text=frames[state['index']],
-                                            char_height=16,
-                                            color=color_hex,
-                                            bg_color=bg_color_hex,
-                                            animation=0,
-                                            speed=inverted_speed
-                                        )
-                                        if asyncio.iscoroutine(result):
-                                            self.run_async(result)
+                                        value_text = frames[state['index']]
+                                        self._enqueue_ble(lambda: self._clock_run_current(run) and send_plain(value_text, 0))
                                         state['index'] = (state['index'] + 1) % len(frames)
                                         self.countdown_static_timer = self.root.after(delay_ms, tick)
 
                                     tick()
                                 else:
-                                    color_hex = self.countdown_color.lstrip('#')
-                                    bg_color_hex = self.countdown_bg_color.lstrip('#')
-                                    inverted_speed = 101 - self.countdown_speed_var.get()
-                                    result = self.client.send_text(
-                                        text=frames[0],
-                                        char_height=16,
-                                        color=color_hex,
-                                        bg_color=bg_color_hex,
-                                        animation=0,
-                                        speed=inverted_speed
-                                    )
-                                    if asyncio.iscoroutine(result):
-                                        self.run_async(result)
+                                    send_plain(frames[0], 0)
                                 return
 
-                            color_hex = self.countdown_color.lstrip('#')
-                            bg_color_hex = self.countdown_bg_color.lstrip('#')
-
-                            # Invert speed: 1=slowest (100), 100=fastest (1)
-                            inverted_speed = 101 - self.countdown_speed_var.get()
-
-                            result = self.client.send_text(
-                                text=countdown_text,
-                                char_height=16,
-                                color=color_hex,
-                                bg_color=bg_color_hex,
-                                animation=anim_map.get(animation, 0),
-                                speed=inverted_speed
-                            )
-
-                            if asyncio.iscoroutine(result):
-                                self.run_async(result)
+                            send_plain(countdown_text, self._ANIMATION_CODES.get(animation, 0))
                     except Exception as e:
                         error_msg = str(e)
-                        self.root.after(0, lambda: messagebox.showerror("Error", f"Countdown update failed: {error_msg}"))
+                        self._ui(messagebox.showerror, "Error", f"Countdown update failed: {error_msg}")
                         self.root.after(0, self.stop_live_clock)
                 
-                threading.Thread(target=send_task, daemon=True).start()
+                # A static countdown already showing these frames needs no resend;
+                # flash/scroll are driven by the device and are refreshed every tick
+                payload = (countdown_text, frames, animation, format_choice,
+                           color_hex, bg_color_hex, use_sprite, font, static_delay)
+                unchanged = animation == "static" and payload == self._last_countdown_payload
+                
+                # Skip this tick if the previous one has not reached the panel yet
+                skipped = not unchanged and self._clock_send_inflight.is_set()
+                if not unchanged and not skipped:
+                    # The new send starts its own frame cycle
+                    if self.countdown_static_timer:
+                        self.root.after_cancel(self.countdown_static_timer)
+                        self.countdown_static_timer = None
+                    self._last_countdown_payload = payload
+                    self._clock_send_inflight.set()
+                    self._enqueue_ble(self._clock_job(send_task, run))
                 
                 # Schedule next update
                 if self.clock_running:
                     interval = self.countdown_update_interval_var.get() * 1000
+                    step = self._COUNTDOWN_STEPS.get(format_choice, 60)
+                    if animation == "static" and not passed and not skipped and interval < step * 1000:
+                        # Text only changes on the minute/hour/day; wake just after it does.
+                        # A skipped send retries at the normal interval instead
+                        interval = int((remaining % step) * 1000) + 50
                     self.clock_timer = self.root.after(interval, update_countdown)
             
             except Exception as e:
@@ -4218,6 +4915,25 @@ class iPixelController:
         # Start the update loop
         update_countdown()
     
+    def _get_countdown_frames(self, key):
+        """Return the static countdown frames for key, reusing the last list when unchanged"""
+        if key == self._last_frames_key:
+            return self._last_frames
+        format_choice, days, hours, minutes, event_name = key
+        if days is None:
+            if format_choice == "with_name":
+                frames = [event_name.strip() or "Event", "NOW!"]
+            else:
+                frames = ["NOW!"]
+        else:
+            builder = self._COUNTDOWN_FRAME_BUILDERS.get(
+                format_choice, self._COUNTDOWN_FRAME_BUILDERS["days_hours_mins"]
+            )
+            frames = builder(days, hours, minutes, event_name)
+        self._last_frames_key = key
+        self._last_frames = frames
+        return frames
+    
     def set_brightness(self):
         """Set display brightness"""
         self.set_brightness_btn.config(state=tk.DISABLED, text="Setting...")
@@ -4229,9 +4945,9 @@ class iPixelController:
                     self.run_async(result)
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to set brightness: {error_msg}"))
+                self._ui(messagebox.showerror, "Error", f"Failed to set brightness: {error_msg}")
             finally:
-                self.root.after(0, lambda: self.set_brightness_btn.config(state=tk.NORMAL, text="Set Brightness"))
+                self._ui(self.set_brightness_btn.config, state=tk.NORMAL, text="Set Brightness")
         
         threading.Thread(target=send_task, daemon=True).start()
     
@@ -4239,6 +4955,7 @@ class iPixelController:
         """Set display power state"""
         btn = self.power_on_btn if state else self.power_off_btn
         btn.config(state=tk.DISABLED)
+        self._current_preset_name = None
         
         def send_task():
             try:
@@ -4247,29 +4964,58 @@ class iPixelController:
                     self.run_async(result)
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to set power: {error_msg}"))
+                self._ui(messagebox.showerror, "Error", f"Failed to set power: {error_msg}")
             finally:
-                self.root.after(0, lambda: btn.config(state=tk.NORMAL))
+                self._ui(btn.config, state=tk.NORMAL)
         
         threading.Thread(target=send_task, daemon=True).start()
     
     # ===== PRESET MANAGEMENT FUNCTIONS =====
     
+    def on_close(self):
+        """Flush pending saves and close the application"""
+        if self._save_presets_job:
+            self.save_presets()
+        if self._save_settings_pending:
+            self._do_save_settings(background=False)
+        else:
+            self._flush_settings_writer()
+        if self._aio_session is not None and not self._aio_session.closed and self.loop:
+            # Close the shared HTTP session on its own loop so it does not warn at exit
+            try:
+                asyncio.run_coroutine_threadsafe(self._aio_session.close(), self.loop).result(timeout=2)
+            except Exception as e:
+                print(f"Failed to close HTTP session: {e}")
+        self.root.destroy()
+    
     def load_presets(self):
         """Load presets from JSON file"""
         try:
             if os.path.exists(self.presets_file):
-                with open(self.presets_file, 'r') as f:
-                    self.presets = json.load(f)
+                self.presets = _json_load(self.presets_file)
         except Exception as e:
             print(f"Failed to load presets: {e}")
             self.presets = []
+        self._rebuild_preset_index()
+    
+    def _rebuild_preset_index(self):
+        """Rebuild the name -> preset lookup (first preset wins on duplicate names)"""
+        self._preset_by_name = {p.get('name'): p for p in reversed(self.presets)}
+    
+    def _schedule_save_presets(self):
+        """Coalesce preset saves into one write 500ms after the last change"""
+        self._rebuild_preset_index()
+        if self._save_presets_job:
+            self.root.after_cancel(self._save_presets_job)
+        self._save_presets_job = self.root.after(500, self.save_presets)
     
     def save_presets(self):
         """Save presets to JSON file"""
+        if self._save_presets_job:
+            self.root.after_cancel(self._save_presets_job)
+            self._save_presets_job = None
         try:
-            with open(self.presets_file, 'w') as f:
-                json.dump(self.presets, f, indent=2)
+            _atomic_write(self.presets_file, _json_dumps(self.presets))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save presets: {e}")
     
@@ -4277,8 +5023,7 @@ class iPixelController:
         """Load app settings from JSON file"""
         try:
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    return json.load(f)
+                return _json_load(self.settings_file)
         except Exception as e:
             print(f"Failed to load settings: {e}")
         return {
@@ -4290,11 +5035,60 @@ class iPixelController:
             'weather_temp_image_dir': ''
         }
     
-    def save_settings(self):
+    def _schedule_save_settings(self):
+        """Coalesce settings saves into one write within 500ms of the first change"""
+        # The pending write serializes self.settings when it fires, so later
+        # changes in the burst are picked up without rescheduling
+        if self._save_settings_pending:
+            return
+        self._save_settings_pending = self.root.after(500, self._do_save_settings)
+    
+    def _do_save_settings(self, background=True):
         """Save app settings to JSON file"""
+        if self._save_settings_pending:
+            self.root.after_cancel(self._save_settings_pending)
+            self._save_settings_pending = None
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            # Serialize on the Tk thread so the dict is not mutated mid-dump
+            data = _json_dumps(self.settings)
+        except Exception as e:
+            print(f"Failed to save settings: {e}")
+            return
+        if background:
+            self._settings_pending_data = data
+            self._settings_write_event.set()
+        else:
+            self._write_settings_file(data)
+    
+    def _settings_writer(self):
+        """Write the newest pending settings snapshot, one write at a time"""
+        while True:
+            self._settings_write_event.wait()
+            # Clear before taking the slot so a snapshot arriving now is not lost
+            self._settings_write_event.clear()
+            with self._settings_write_lock:
+                data = self._settings_pending_data
+                self._settings_pending_data = None
+                if data is not None:
+                    self._store_settings(data)
+    
+    def _flush_settings_writer(self):
+        """Write a snapshot still waiting for the background writer, before the process exits"""
+        with self._settings_write_lock:
+            data = self._settings_pending_data
+            self._settings_pending_data = None
+            if data is not None:
+                self._store_settings(data)
+    
+    def _write_settings_file(self, data):
+        with self._settings_write_lock:
+            # This snapshot is newer than anything still waiting for the writer
+            self._settings_pending_data = None
+            self._store_settings(data)
+    
+    def _store_settings(self, data):
+        try:
+            _atomic_write(self.settings_file, data)
         except Exception as e:
             print(f"Failed to save settings: {e}")
 
@@ -4302,10 +5096,9 @@ class iPixelController:
         """Load API keys from a secrets file"""
         try:
             if os.path.exists(self.secrets_file):
-                with open(self.secrets_file, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        return data
+                data = _json_load(self.secrets_file)
+                if isinstance(data, dict):
+                    return data
         except Exception as e:
             print(f"Failed to load secrets: {e}")
         return {
@@ -4316,8 +5109,7 @@ class iPixelController:
     def save_secrets(self):
         """Save API keys to a secrets file"""
         try:
-            with open(self.secrets_file, 'w') as f:
-                json.dump(self.secrets, f, indent=2)
+            _atomic_write(self.secrets_file, _json_dumps(self.secrets))
         except Exception as e:
             print(f"Failed to save secrets: {e}")
     
@@ -4334,11 +5126,8 @@ class iPixelController:
         def scan_and_connect():
             try:
                 # Wait for event loop to be ready
-                import time
-                for _ in range(10):
-                    if self.loop and self.loop.is_running():
-                        break
-                    time.sleep(0.1)
+                if not self._loop_ready.wait(timeout=1.0):
+                    raise Exception("event loop did not start")
                 
                 # Scan for devices
                 future = asyncio.run_coroutine_threadsafe(self._scan_devices(), self.loop)
@@ -4348,18 +5137,18 @@ class iPixelController:
                 for device_name, device_addr in devices.items():
                     if device_addr == last_device:
                         # Found the device, connect
-                        self.root.after(0, lambda: self._auto_connect_found(device_name, device_addr, devices))
+                        self._ui(self._auto_connect_found, device_name, device_addr, devices)
                         return
                 
                 # Device not found
-                self.root.after(0, lambda: self.status_label.config(
+                self._ui(self.status_label.config,
                     text="Last device not found. Please connect manually.", 
-                    foreground="orange"))
+                    foreground="orange")
             except Exception as e:
                 print(f"Auto-connect failed: {e}")
-                self.root.after(0, lambda: self.status_label.config(
+                self._ui(self.status_label.config,
                     text="Not connected", 
-                    foreground="red"))
+                    foreground="red")
         
         threading.Thread(target=scan_and_connect, daemon=True).start()
     
@@ -4388,58 +5177,77 @@ class iPixelController:
             return
         
         # Find the preset
-        preset = next((p for p in self.presets if p['name'] == last_preset_name), None)
+        preset = self._preset_by_name.get(last_preset_name)
         if preset:
             self.execute_preset(preset)
     
     def generate_thumbnail(self, image_path, max_size=(64, 16)):
-        """Generate a thumbnail from an image file and return as base64 string"""
+        """Generate a thumbnail PNG for an image file and return its path"""
         try:
             image_path = self._resolve_asset_path(image_path)
-            if not os.path.exists(image_path):
+            try:
+                st = os.stat(image_path)
+            except OSError:
                 return None
             
+            # Name the file after the source path and mtime so an unchanged
+            # image reuses its existing thumbnail
+            key = f"{image_path}:{st.st_mtime}:{max_size[0]}x{max_size[1]}"
+            thumb_path = os.path.join(self.thumbnails_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.png')
+            if os.path.exists(thumb_path):
+                return thumb_path
+            
             # Open and resize image
             img = Image.open(image_path)
+            if img.format == 'JPEG':
+                # Let libjpeg decode at reduced scale, keeping 4x headroom like reduce() below
+                img.draft('RGB', (max_size[0] * 4, max_size[1] * 4))
             
             # Handle animated GIFs - get first frame
             if hasattr(img, 'is_animated') and img.is_animated:
                 img.seek(0)
             
-            # Convert RGBA to RGB if needed
+            # Convert RGBA to RGB if needed; fully opaque images need no compositing
             if img.mode == 'RGBA':
-                background = Image.new('RGB', img.size, (0, 0, 0))
-                background.paste(img, mask=img.split()[3])
-                img = background
+                alpha = img.getchannel('A')
+                if alpha.getextrema()[0] == 255:
+                    img = img.convert('RGB')
+                else:
+                    background = Image.new('RGB', img.size, (0, 0, 0))
+                    background.paste(img, mask=alpha)
+                    img = background
             elif img.mode != 'RGB':
                 img = img.convert('RGB')
             
+            # Box-reduce large sources first so LANCZOS only runs on a small
+            # buffer; keep 4x headroom over the target so quality is unchanged
+            reduce_factor = min(img.width // (max_size[0] * 4), img.height // (max_size[1] * 4))
+            if reduce_factor >= 2:
+                img = img.reduce(reduce_factor)
+            
             # Crop to fill the thumbnail area (no black borders)
             img_ratio = img.width / img.height
             thumb_ratio = max_size[0] / max_size[1]
             
-            if img_ratio > thumb_ratio:
-                # Image is wider - crop width
-                new_height = max_size[1]
-                new_width = int(new_height * img_ratio)
-                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                left = (new_width - max_size[0]) // 2
-                img = img.crop((left, 0, left + max_size[0], max_size[1]))
+            if img.size == tuple(max_size):
+                pass  # Already the thumbnail size
+            elif img_ratio > thumb_ratio:
+                # Image is wider - crop width (in source pixels, so LANCZOS
+                # only reads the region that ends up in the thumbnail)
+                src_width = img.height * thumb_ratio
+                left = (img.width - src_width) / 2
+                img = img.resize(tuple(max_size), Image.Resampling.LANCZOS,
+                                 box=(left, 0, left + src_width, img.height), reducing_gap=2.0)
             else:
                 # Image is taller - crop height
-                new_width = max_size[0]
-                new_height = int(new_width / img_ratio)
-                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                top = (new_height - max_size[1]) // 2
-                img = img.crop((0, top, max_size[0], top + max_size[1]))
+                src_height = img.width / thumb_ratio
+                top = (img.height - src_height) / 2
+                img = img.resize(tuple(max_size), Image.Resampling.LANCZOS,
+                                 box=(0, top, img.width, top + src_height), reducing_gap=2.0)
             
-            # Convert to base64
-            import base64
-            from io import BytesIO
-            buffer = BytesIO()
-            img.save(buffer, format='PNG')
-            img_str = base64.b64encode(buffer.getvalue()).decode()
-            return img_str
+            os.makedirs(self.thumbnails_dir, exist_ok=True)
+            img.save(thumb_path, format='PNG')
+            return thumb_path
         except Exception as e:
             print(f"Failed to generate thumbnail: {e}")
             return None
@@ -4478,7 +5286,6 @@ class iPixelController:
             clock_mode = preset.get('clock_mode', 'builtin')
             if clock_mode == 'custom':
                 format_preview = preset.get('time_format', '%H:%M:%S')
-                import time
                 return time.strftime(format_preview)
             elif clock_mode == 'countdown':
                 event = preset.get('countdown_event', 'Event')
@@ -4557,177 +5364,352 @@ class iPixelController:
     
     def refresh_preset_buttons(self):
         """Refresh the preset buttons display"""
-        # Clear existing buttons and cache
-        for widget in self.presets_scrollable_frame.winfo_children():
-            widget.destroy()
-        self.thumbnail_cache.clear()
+        if self._preset_build_job:
+            self.root.after_cancel(self._preset_build_job)
+            self._preset_build_job = None
+        # Rows are keyed by preset content; unchanged rows are kept as they are
+        # and only new or edited presets get fresh widgets
+        old_rows = {}
+        for row_key, row_frame, thumb_key in self._preset_rows:
+            if row_frame is not None:
+                old_rows.setdefault(row_key, []).append((row_frame, thumb_key))
+        if self._preset_empty_label is not None:
+            self._preset_empty_label.destroy()
+            self._preset_empty_label = None
+        # Keep thumbnails whose content is unchanged; only new ones are rendered
+        old_thumbs = self.thumbnail_cache
+        self.thumbnail_cache = {}
+        self._preset_rows = []
+        pending = []
+        
+        for idx, preset in enumerate(self.presets):
+            # Unnamed presets are labelled by position, so their rows are too
+            row_key = (_json_dumps(preset), None if preset.get('name') else idx)
+            reused = old_rows.get(row_key)
+            if reused:
+                row_frame, thumb_key = reused.pop(0)
+                if thumb_key is not None:
+                    self.thumbnail_cache[thumb_key] = old_thumbs[thumb_key]
+                self._preset_rows.append((row_key, row_frame, thumb_key))
+            else:
+                self._preset_rows.append((row_key, None, None))
+                pending.append((idx, preset))
+        
+        for leftovers in old_rows.values():
+            for row_frame, _ in leftovers:
+                row_frame.destroy()
+        
+        self._repack_preset_rows()
         
         if not self.presets:
-            ttk.Label(self.presets_scrollable_frame, 
+            self._preset_empty_label = ttk.Label(self.presets_scrollable_frame, 
                      text="No presets saved yet. Use other tabs to create content, then save it as a preset.",
-                     foreground="gray").pack(pady=20)
+                     foreground="gray")
+            self._preset_empty_label.pack(pady=20)
+        elif pending:
+            self._build_pending_preset_rows(pending, old_thumbs)
+    
+    def _build_pending_preset_rows(self, pending, old_thumbs):
+        """Build up to 10 missing preset rows, then let Tk breathe before the next batch"""
+        self._preset_build_job = None
+        prefetched = self._prefetch_preset_previews(pending[:10], old_thumbs)
+        for idx, preset in pending[:10]:
+            row_frame, thumb_key = self._build_preset_row(idx, preset, old_thumbs, prefetched)
+            self._preset_rows[idx] = (self._preset_rows[idx][0], row_frame, thumb_key)
+        self._repack_preset_rows()
+        if len(pending) > 10:
+            self._preset_build_job = self.root.after_idle(
+                self._build_pending_preset_rows, pending[10:], old_thumbs
+            )
+    
+    def _prefetch_preset_previews(self, batch, old_thumbs):
+        """Start decoding the batch's preview PNGs on worker threads; returns path -> future"""
+        # Only file loads go to the pool: text is still drawn on the Tk thread,
+        # since the shared FreeType font is not safe to use concurrently
+        paths = []
+        for idx, preset in batch:
+            preset_type = preset.get('type')
+            if preset_type == "image":
+                path = preset.get('thumbnail_path')
+                if path and ('image', path) not in old_thumbs:
+                    paths.append(path)
+            elif preset_type == "text" and 'text' in preset:
+                key = self._text_preview_key(preset)
+                if key not in old_thumbs:
+                    paths.append(self._text_preview_path(key))
+        if not paths:
+            return {}
+        if self._preview_pool is None:
+            self._preview_pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        return {path: self._preview_pool.submit(_load_png, path) for path in paths}
+    
+    def _open_preview(self, path, prefetched):
+        """Return a preview image, from its prefetch when one was started"""
+        future = prefetched.get(path) if prefetched else None
+        return future.result() if future is not None else _load_png(path)
+    
+    def _preview_photo(self, img, old_thumbs):
+        """PhotoImage for a preview, repainting one whose preset is gone instead of allocating"""
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        # Thumbnails left behind by edited or deleted presets are no longer shown;
+        # claiming one drops it from old_thumbs so no later row picks up stale pixels
+        for key, photo in old_thumbs.items():
+            if key not in self.thumbnail_cache and (photo.width(), photo.height()) == img.size:
+                del old_thumbs[key]
+                photo.paste(img)
+                return photo
+        return ImageTk.PhotoImage(img)
+    
+    def _text_preview_key(self, preset):
+        """Thumbnail cache key for a text preset's preview"""
+        return ('text', preset['text'], preset.get('text_color', '#FFFFFF'), preset.get('bg_color', '#000000'))
+    
+    def _text_preview_path(self, thumb_key):
+        """On-disk cache file for a rendered text preview, specific to renderer version and font"""
+        ident = (self._TEXT_PREVIEW_VERSION, _preview_font_id(), thumb_key)
+        digest = hashlib.blake2b(repr(ident).encode('utf-8'), digest_size=8).hexdigest()
+        return os.path.join(self.thumbnails_dir, f"text_{digest}.png")
+    
+    def _prune_text_previews(self):
+        """Delete cached text preview files that no current preset uses"""
+        live = {
+            os.path.basename(self._text_preview_path(self._text_preview_key(p)))
+            for p in self.presets if p.get('type') == "text" and 'text' in p
+        }
+        try:
+            names = os.listdir(self.thumbnails_dir)
+        except OSError:
             return
+        for name in names:
+            if name.startswith('text_') and name not in live:
+                try:
+                    os.remove(os.path.join(self.thumbnails_dir, name))
+                except OSError:
+                    pass
+    
+    def _repack_preset_rows(self):
+        """Pack the built preset rows in list order (kept rows may have moved)"""
+        for _, row_frame, _ in self._preset_rows:
+            if row_frame is not None:
+                row_frame.pack_forget()
+        for _, row_frame, _ in self._preset_rows:
+            if row_frame is not None:
+                row_frame.pack(fill=tk.X, pady=5, padx=5)
+    
+    def _render_text_preview(self, text_content, fg_color, bg_color):
+        """Draw a text preset preview at 64x16 and return it scaled 2x"""
+        # Text is rendered at 64x16 (native resolution) on one reused surface
+        if self._thumb_canvas is None:
+            small = Image.new('RGB', (64, 16))
+            self._thumb_canvas = (small, ImageDraw.Draw(small), np.empty((32, 128, 3), dtype=np.uint8))
+        thumb_img, draw, big = self._thumb_canvas
+        thumb_img.paste(bg_color, (0, 0, 64, 16))
+        
+        font = _preview_font()
+        
+        # Wrap text to fit 64 pixels width
+        words = text_content.split()
+        lines = []
+        current_line = []
+        # Sum per-word advances instead of re-measuring each candidate line
+        space_w = _preview_text_advance(' ')
+        line_w = 0
+        for word in words:
+            word_w = _preview_text_advance(word)
+            added_w = word_w + (space_w if current_line else 0)
+            if line_w + added_w <= 62:  # 2px margin
+                current_line.append(word)
+                line_w += added_w
+            else:
+                if current_line:
+                    lines.append((' '.join(current_line), line_w))
+                    if len(lines) == 2:
+                        # Only two lines fit; the rest of the text is never drawn
+                        current_line = []
+                        break
+                current_line = [word]
+                line_w = word_w
+        if current_line:
+            lines.append((' '.join(current_line), line_w))
+        
+        # Limit to 2 lines (16px height)
+        lines = lines[:2]
+        
+        # Draw text centered, using the advance widths summed while wrapping
+        y_offset = (16 - len(lines) * 8) // 2
+        for i, (line, line_w) in enumerate(lines):
+            x = (64 - int(line_w)) // 2
+            draw.text((x, y_offset + i * 8), line, fill=fg_color, font=font)
+        
+        # Scale up 2x for better visibility: a nearest-neighbour 2x is each pixel
+        # broadcast into a 2x2 block of the reused buffer
+        big.reshape(16, 2, 64, 2, 3)[...] = np.asarray(thumb_img)[:, None, :, None, :]
+        return Image.fromarray(big)
+    
+    def _build_preset_row(self, idx, preset, old_thumbs, prefetched=None):
+        """Create the (unpacked) row widgets for one preset; returns (frame, thumbnail key)"""
+        preset_frame = ttk.Frame(self.presets_scrollable_frame, relief=tk.RIDGE, borderwidth=1)
+        thumb_key = None
         
-        # Create buttons for each preset
-        for idx, preset in enumerate(self.presets):
-            preset_frame = ttk.Frame(self.presets_scrollable_frame, relief=tk.RIDGE, borderwidth=1)
-            preset_frame.pack(fill=tk.X, pady=5, padx=5)
-            
-            # Get preview info
-            preview_text = self.get_preset_preview(preset)
-            preset_type = preset.get('type', 'unknown')
-            
-            # Preview label (left side) - colored background
-            preview_frame = tk.Frame(preset_frame, width=128, height=32, bg='black')
-            preview_frame.pack(side=tk.LEFT, padx=5, pady=5)
-            preview_frame.pack_propagate(False)
-            
-            # Get colors for preview
-            if preset_type == "text":
-                fg_color = preset.get('text_color', '#FFFFFF')
-                bg_color = preset.get('bg_color', '#000000')
-            elif preset_type == "stock":
-                fg_color = preset.get('text_color', '#00FF00')
-                bg_color = preset.get('bg_color', '#000000')
-            elif preset_type == "youtube":
-                fg_color = preset.get('text_color', '#FFFFFF')
-                bg_color = preset.get('bg_color', '#000000')
-            elif preset_type == "weather":
-                fg_color = preset.get('text_color', '#FFFFFF')
-                bg_color = preset.get('bg_color', '#000000')
-            elif preset_type == "animation":
-                fg_color = '#FFFFFF'
-                bg_color = '#000000'
-            elif preset_type == "clock":
-                clock_mode = preset.get('clock_mode', 'builtin')
-                if clock_mode == 'custom':
-                    fg_color = preset.get('clock_color', '#00ffff')
-                    bg_color = preset.get('clock_bg_color', '#000000')
-                elif clock_mode == 'countdown':
-                    fg_color = preset.get('countdown_color', '#00ff00')
-                    bg_color = preset.get('countdown_bg_color', '#000000')
-                else:
-                    fg_color = '#FFFFFF'
-                    bg_color = '#000000'
-            else:  # image
+        # Get preview info
+        preview_text = self.get_preset_preview(preset)
+        preset_type = preset.get('type', 'unknown')
+        
+        # Preview label (left side) - colored background
+        preview_frame = tk.Frame(preset_frame, width=128, height=32, bg='black')
+        preview_frame.pack(side=tk.LEFT, padx=5, pady=5)
+        preview_frame.pack_propagate(False)
+        
+        # Get colors for preview
+        if preset_type == "text":
+            fg_color = preset.get('text_color', '#FFFFFF')
+            bg_color = preset.get('bg_color', '#000000')
+        elif preset_type == "stock":
+            fg_color = preset.get('text_color', '#00FF00')
+            bg_color = preset.get('bg_color', '#000000')
+        elif preset_type == "youtube":
+            fg_color = preset.get('text_color', '#FFFFFF')
+            bg_color = preset.get('bg_color', '#000000')
+        elif preset_type == "weather":
+            fg_color = preset.get('text_color', '#FFFFFF')
+            bg_color = preset.get('bg_color', '#000000')
+        elif preset_type == "animation":
+            fg_color = '#FFFFFF'
+            bg_color = '#000000'
+        elif preset_type == "clock":
+            clock_mode = preset.get('clock_mode', 'builtin')
+            if clock_mode == 'custom':
+                fg_color = preset.get('clock_color', '#00ffff')
+                bg_color = preset.get('clock_bg_color', '#000000')
+            elif clock_mode == 'countdown':
+                fg_color = preset.get('countdown_color', '#00ff00')
+                bg_color = preset.get('countdown_bg_color', '#000000')
+            else:
                 fg_color = '#FFFFFF'
                 bg_color = '#000000'
-            
-            preview_frame.config(bg=bg_color)
-            
-            # Check if preset has thumbnail data (for images/gifs)
-            thumbnail_data = preset.get('thumbnail')
-            if thumbnail_data and preset_type == "image":
-                try:
-                    # Decode base64 thumbnail and display
-                    import base64
-                    from io import BytesIO
-                    img_data = base64.b64decode(thumbnail_data)
-                    img = Image.open(BytesIO(img_data))
+        else:  # image
+            fg_color = '#FFFFFF'
+            bg_color = '#000000'
+        
+        preview_frame.config(bg=bg_color)
+        
+        # Check if preset has a thumbnail (for images/gifs); older presets
+        # carry it inline as base64
+        thumbnail_path = preset.get('thumbnail_path')
+        thumbnail_data = preset.get('thumbnail')
+        if (thumbnail_path or thumbnail_data) and preset_type == "image":
+            try:
+                # The thumbnail file name already encodes the source path and mtime
+                thumb_key = ('image', thumbnail_path or thumbnail_data)
+                photo = old_thumbs.get(thumb_key)
+                if photo is None:
+                    img = None
+                    if thumbnail_path:
+                        try:
+                            img = self._open_preview(thumbnail_path, prefetched)
+                        except OSError:
+                            # Thumbnail files are local to this machine (e.g. the preset
+                            # was imported); rebuild it from the source image if we can
+                            thumbnail_path = self.generate_thumbnail(preset.get('image_path', ''))
+                            if thumbnail_path:
+                                preset['thumbnail_path'] = thumbnail_path
+                                self._schedule_save_presets()
+                                img = Image.open(thumbnail_path)
+                            elif not thumbnail_data:
+                                raise
+                    if img is None:
+                        img = Image.open(BytesIO(base64.b64decode(thumbnail_data)))
                     # Scale up 2x for better visibility
                     img = img.resize((128, 32), Image.Resampling.NEAREST)
-                    photo = ImageTk.PhotoImage(img)
-                    self.thumbnail_cache[f"thumb_{idx}"] = photo  # Keep reference
-                    preview_label = tk.Label(preview_frame, image=photo, bg=bg_color)
-                    preview_label.pack(expand=True)
-                except Exception as e:
-                    print(f"Failed to display thumbnail: {e}")
-                    # Fallback to text
-                    preview_label = tk.Label(preview_frame, text=preview_text, 
-                                            fg=fg_color, bg=bg_color,
-                                            font=('Courier', 8, 'bold'), wraplength=120)
-                    preview_label.pack(expand=True)
-            elif preset_type == "text":
-                # Render actual text preview for text presets
-                try:
-                    text_content = preset.get('text', preview_text)
-                    # Create image with text rendered at 64x16 (native resolution)
-                    thumb_img = Image.new('RGB', (64, 16), bg_color)
-                    draw = ImageDraw.Draw(thumb_img)
-                    
-                    # Try to load a font, fallback to default
+                    photo = self._preview_photo(img, old_thumbs)
+                self.thumbnail_cache[thumb_key] = photo  # Keep reference
+                preview_label = tk.Label(preview_frame, image=photo, bg=bg_color)
+                preview_label.pack(expand=True)
+            except Exception as e:
+                print(f"Failed to display thumbnail: {e}")
+                # Fallback to text
+                preview_label = tk.Label(preview_frame, text=preview_text, 
+                                        fg=fg_color, bg=bg_color,
+                                        font=('Courier', 8, 'bold'), wraplength=120)
+                preview_label.pack(expand=True)
+        elif preset_type == "text":
+            # Render actual text preview for text presets
+            try:
+                text_content = preset.get('text', preview_text)
+                thumb_key = ('text', text_content, fg_color, bg_color)
+                photo = old_thumbs.get(thumb_key)
+                if photo is None:
+                    # Rendered previews persist on disk by content hash, so later
+                    # sessions load a PNG instead of wrapping and drawing again
+                    cache_path = self._text_preview_path(thumb_key)
                     try:
-                        font = ImageFont.truetype("arial.ttf", 8)
-                    except:
-                        font = ImageFont.load_default()
-                    
-                    # Wrap text to fit 64 pixels width
-                    words = text_content.split()
-                    lines = []
-                    current_line = []
-                    for word in words:
-                        test_line = ' '.join(current_line + [word])
-                        bbox = draw.textbbox((0, 0), test_line, font=font)
-                        if bbox[2] - bbox[0] <= 62:  # 2px margin
-                            current_line.append(word)
-                        else:
-                            if current_line:
-                                lines.append(' '.join(current_line))
-                            current_line = [word]
-                    if current_line:
-                        lines.append(' '.join(current_line))
-                    
-                    # Limit to 2 lines (16px height)
-                    lines = lines[:2]
-                    
-                    # Draw text centered
-                    y_offset = (16 - len(lines) * 8) // 2
-                    for i, line in enumerate(lines):
-                        bbox = draw.textbbox((0, 0), line, font=font)
-                        text_width = bbox[2] - bbox[0]
-                        x = (64 - text_width) // 2
-                        draw.text((x, y_offset + i * 8), line, fill=fg_color, font=font)
-                    
-                    # Scale up 2x for better visibility
-                    thumb_img = thumb_img.resize((128, 32), Image.Resampling.NEAREST)
-                    photo = ImageTk.PhotoImage(thumb_img)
-                    self.thumbnail_cache[f"thumb_{idx}"] = photo
-                    preview_label = tk.Label(preview_frame, image=photo, bg=bg_color)
-                    preview_label.pack(expand=True)
-                except Exception as e:
-                    print(f"Failed to render text thumbnail: {e}")
-                    # Fallback to simple label
-                    preview_label = tk.Label(preview_frame, text=preview_text, 
-                                            fg=fg_color, bg=bg_color,
-                                            font=('Courier', 8, 'bold'), wraplength=120)
-                    preview_label.pack(expand=True)
-            else:
-                # Clock or other presets - use text preview
+                        thumb_img = self._open_preview(cache_path, prefetched)
+                    except (OSError, SyntaxError, ValueError) as e:
+                        if not isinstance(e, FileNotFoundError):
+                            # A damaged cache file would fail the same way every time
+                            try:
+                                os.remove(cache_path)
+                            except OSError:
+                                pass
+                        thumb_img = self._render_text_preview(text_content, fg_color, bg_color)
+                        try:
+                            os.makedirs(self.thumbnails_dir, exist_ok=True)
+                            buf = BytesIO()
+                            thumb_img.save(buf, format='PNG')
+                            _atomic_write(cache_path, buf.getvalue())
+                        except OSError as e:
+                            print(f"Failed to cache text thumbnail: {e}")
+                    photo = self._preview_photo(thumb_img, old_thumbs)
+                self.thumbnail_cache[thumb_key] = photo
+                preview_label = tk.Label(preview_frame, image=photo, bg=bg_color)
+                preview_label.pack(expand=True)
+            except Exception as e:
+                print(f"Failed to render text thumbnail: {e}")
+                # Fallback to simple label
                 preview_label = tk.Label(preview_frame, text=preview_text, 
                                         fg=fg_color, bg=bg_color,
                                         font=('Courier', 8, 'bold'), wraplength=120)
                 preview_label.pack(expand=True)
-            
-            # Info frame (middle)
-            info_frame = ttk.Frame(preset_frame)
-            info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-            
-            # Preset name and type
-            name_label = ttk.Label(info_frame, text=preset.get('name', f'Preset {idx+1}'),
-                                  font=('TkDefaultFont', 10, 'bold'))
-            name_label.pack(anchor=tk.W)
-            
-            # Type and details
-            type_icon = {"text": "📝", "image": "🖼️", "clock": "🕐", "stock": "📈", "youtube": "📺", "weather": "🌤️", "animation": "🎨"}.get(preset_type, "❓")
-            details = self.get_preset_details(preset)
-            details_label = ttk.Label(info_frame, text=f"{type_icon} {preset_type.upper()}: {details}",
-                                     foreground="gray", font=('TkDefaultFont', 8))
-            details_label.pack(anchor=tk.W)
-            
-            # Buttons frame (right side)
-            btn_frame = ttk.Frame(preset_frame)
-            btn_frame.pack(side=tk.RIGHT, padx=5, pady=5)
-            
-            # Execute button
-            preset_btn = ttk.Button(btn_frame, text="▶️ Execute", width=12,
-                                   command=lambda p=preset: self.execute_preset(p))
-            preset_btn.pack(side=tk.TOP, pady=(0, 2))
-            
-            # Delete button
-            del_btn = ttk.Button(btn_frame, text="🗑️ Delete", width=12,
-                               command=lambda i=idx: self.delete_preset(i))
-            del_btn.pack(side=tk.TOP)
-    
+        else:
+            # Clock or other presets - use text preview
+            preview_label = tk.Label(preview_frame, text=preview_text, 
+                                    fg=fg_color, bg=bg_color,
+                                    font=('Courier', 8, 'bold'), wraplength=120)
+            preview_label.pack(expand=True)
+        
+        # Info frame (middle)
+        info_frame = ttk.Frame(preset_frame)
+        info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
+        
+        # Preset name and type
+        name_label = ttk.Label(info_frame, text=preset.get('name', f'Preset {idx+1}'),
+                              font=('TkDefaultFont', 10, 'bold'))
+        name_label.pack(anchor=tk.W)
+        
+        # Type and details
+        type_icon = self._PRESET_TYPE_ICONS.get(preset_type, "❓")
+        details = self.get_preset_details(preset)
+        details_label = ttk.Label(info_frame, text=f"{type_icon} {preset_type.upper()}: {details}",
+                                 foreground="gray", font=('TkDefaultFont', 8))
+        details_label.pack(anchor=tk.W)
+        
+        # Buttons frame (right side)
+        btn_frame = ttk.Frame(preset_frame)
+        btn_frame.pack(side=tk.RIGHT, padx=5, pady=5)
+        
+        # Execute button
+        preset_btn = ttk.Button(btn_frame, text="▶️ Execute", width=12,
+                               command=lambda p=preset: self.execute_preset(p))
+        preset_btn.pack(side=tk.TOP, pady=(0, 2))
+        
+        # Delete button (index looked up on click since kept rows can move)
+        del_btn = ttk.Button(btn_frame, text="🗑️ Delete", width=12,
+                           command=lambda p=preset: self.delete_preset(self.presets.index(p)))
+        del_btn.pack(side=tk.TOP)
+        
+        return preset_frame, (thumb_key if thumb_key in self.thumbnail_cache else None)
+
     def save_current_preset(self):
         """Save current configuration as a preset"""
         # Ask for preset name
@@ -4776,9 +5758,9 @@ class iPixelController:
                 preset["image_path"] = self.image_path if hasattr(self, 'image_path') and self.image_path else ""
                 # Generate thumbnail for image/gif
                 if preset["image_path"] and os.path.exists(preset["image_path"]):
-                    thumbnail = self.generate_thumbnail(preset["image_path"])
-                    if thumbnail:
-                        preset["thumbnail"] = thumbnail
+                    thumbnail_path = self.generate_thumbnail(preset["image_path"])
+                    if thumbnail_path:
+                        preset["thumbnail_path"] = thumbnail_path
             elif preset_type == "clock":
                 # Save both built-in and custom clock settings
                 preset["clock_mode"] = self.clock_mode_var.get()
@@ -4811,13 +5793,132 @@ class iPixelController:
                     preset["countdown_static_delay_seconds"] = int(self.countdown_static_delay_var.get() or 2)
             
             self.presets.append(preset)
-            self.save_presets()
+            self._schedule_save_presets()
             self.refresh_preset_buttons()
             dialog.destroy()
         
         ttk.Button(dialog, text="Save", command=save).pack(pady=10)
     
     def execute_preset(self, preset):
+        """Request a preset; rapid requests collapse to the most recent one"""
+        self._preset_latest = preset
+        self._preset_event.set()
+    
+    def _preset_worker(self):
+        """Apply the latest requested preset on the Tk thread, one at a time"""
+        while True:
+            self._preset_event.wait()
+            # Clear before reading so a request arriving now is not lost
+            self._preset_event.clear()
+            preset = self._preset_latest
+            self._preset_latest = None
+            if preset is None:
+                continue
+            
+            done = threading.Event()
+            
+            def apply(p=preset):
+                try:
+                    self._apply_preset(p)
+                finally:
+                    done.set()
+            
+            self.root.after(0, apply)
+            done.wait()
+    
+    def _cancel_text_cycle(self):
+        """Stop cycling text parts; parts already queued for sending are dropped"""
+        self._text_cycle_run += 1
+        if self.text_static_timer:
+            self.root.after_cancel(self.text_static_timer)
+            self.text_static_timer = None
+    
+    def _send_text_preset(self, preset):
+        """Start a text preset on the Tk thread: sprite or device font, scrolling, static or cycling parts"""
+        # _apply_preset cancelled the previous cycle; sends queued below carry this run
+        run = self._text_cycle_run
+        try:
+            # Read the preset once; every branch below shares these
+            text = preset.get('text', '')
+            bg_color_raw = preset.get('bg_color', '#000000')
+            anim = preset.get('animation', 0)
+            speed = preset.get('speed', 50)
+            # Only static text cycles through its parts
+            parts = self._split_text_parts(text) if anim == 0 else ()
+            
+            if preset.get('text_use_sprite_font', False):
+                font = self._get_sprite_font_by_name(preset.get('text_sprite_font_name', '').strip())
+                if font:
+                    sprite_src = (font.get('path', ''), font.get('order', ''), font.get('cols', 1))
+                else:
+                    legacy_path = preset.get('text_sprite_path', '').strip()
+                    if not legacy_path:
+                        raise Exception("Sprite font not found")
+                    sprite_src = (legacy_path, preset.get('text_sprite_order', ''), preset.get('text_sprite_cols', 1))
+                
+                if anim in (1, 2):
+                    line_img, sprite_err = self._build_sprite_text_line_image(text, *sprite_src, bg_color_raw)
+                    if line_img is None:
+                        raise Exception(sprite_err or "Sprite render failed")
+                    direction = "right" if anim == 2 else "left"
+                    self._start_sprite_scroll(line_img, bg_color_raw, speed, direction=direction)
+                    return
+                
+                def send_value(value_text, animation=0):
+                    sprite_img, sprite_err = self._build_sprite_text_image(value_text, *sprite_src, bg_color_raw)
+                    if sprite_img is None:
+                        raise Exception(sprite_err or "Sprite render failed")
+                    self._send_pil_image(sprite_img, 'ipixel_text_sprite.png')
+            else:
+                text_color = preset.get('text_color', '#FFFFFF').lstrip('#')
+                bg_color = bg_color_raw.lstrip('#')
+                char_height = preset.get('char_height', 16)
+                rainbow = preset.get('rainbow', 0)
+                # Invert speed: 1=slowest (100), 100=fastest (1)
+                inverted_speed = 101 - speed
+                
+                def send_value(value_text, animation=0):
+                    result = self.client.send_text(
+                        value_text,
+                        char_height=char_height,
+                        color=text_color,
+                        bg_color=bg_color,
+                        animation=animation,
+                        speed=inverted_speed,
+                        rainbow_mode=rainbow
+                    )
+                    if asyncio.iscoroutine(result):
+                        self.run_async(result)
+            
+            # Every write goes through the BLE queue; a newer preset drops queued ones
+            def send_part(value_text, animation=0):
+                if self._text_cycle_run != run:
+                    return
+                try:
+                    send_value(value_text, animation)
+                except Exception as e:
+                    self._ui(messagebox.showerror, "Error", f"Failed: {e}")
+            
+            if len(parts) > 1:
+                delay_ms = max(1, int(preset.get('text_static_delay_seconds', 2) or 2)) * 1000
+                state = {'idx': 0}
+                
+                def tick():
+                    if self._text_cycle_run != run:
+                        return
+                    value_text = parts[state['idx']]
+                    self._enqueue_ble(lambda: send_part(value_text))
+                    state['idx'] = (state['idx'] + 1) % len(parts)
+                    self.text_static_timer = self.root.after(delay_ms, tick)
+                
+                tick()
+                return
+            
+            self._enqueue_ble(lambda: send_part(text, anim))
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed: {e}")
+    
+    def _apply_preset(self, preset):
         """Execute a saved preset"""
         if not self.is_connected:
             messagebox.showwarning("Not Connected", "Please connect to a device first")
@@ -4827,9 +5928,7 @@ class iPixelController:
         if hasattr(self, 'clock_running') and self.clock_running:
             self.stop_live_clock()
         self._stop_sprite_scroll()
-        if self.text_static_timer:
-            self.root.after_cancel(self.text_static_timer)
-            self.text_static_timer = None
+        self._cancel_text_cycle()
         if self.countdown_static_timer:
             self.root.after_cancel(self.countdown_static_timer)
             self.countdown_static_timer = None
@@ -4838,163 +5937,19 @@ class iPixelController:
         self.stop_stock_refresh()
         
         # Save as last preset for state restoration
-        self.settings['last_preset'] = preset.get('name')
-        self.save_settings()
+        self.settings['last_preset'] = self._current_preset_name = preset.get('name')
+        self._schedule_save_settings()
         
         preset_type = preset.get('type')
         
         try:
             if preset_type == "text":
-                # Send text with saved settings
-                def send_task():
-                    try:
-                        text = preset.get('text', '')
-                        text_color_raw = preset.get('text_color', '#FFFFFF')
-                        bg_color_raw = preset.get('bg_color', '#000000')
-
-                        if preset.get('text_use_sprite_font', False):
-                            font_name = preset.get('text_sprite_font_name', '').strip()
-                            font = self._get_sprite_font_by_name(font_name)
-                            if font:
-                                anim = preset.get('animation', 0)
-                                if anim in (1, 2):
-                                    line_img, sprite_err = self._build_sprite_text_line_image(
-                                        text,
-                                        font.get('path', ''),
-                                        font.get('order', ''),
-                                        font.get('cols', 1),
-                                        bg_color_raw
-                                    )
-                                    if line_img is None:
-                                        raise Exception(sprite_err or "Sprite render failed")
-                                    direction = "right" if anim == 2 else "left"
-                                    self._start_sprite_scroll(line_img, bg_color_raw, preset.get('speed', 50), direction=direction)
-                                    return
-                                sprite_img, sprite_err = self._build_sprite_text_image(
-                                    text,
-                                    font.get('path', ''),
-                                    font.get('order', ''),
-                                    font.get('cols', 1),
-                                    bg_color_raw
-                                )
-                            else:
-                                legacy_path = preset.get('text_sprite_path', '').strip()
-                                legacy_order = preset.get('text_sprite_order', '')
-                                legacy_cols = preset.get('text_sprite_cols', 1)
-                                if not legacy_path:
-                                    raise Exception("Sprite font not found")
-                                anim = preset.get('animation', 0)
-                                if anim in (1, 2):
-                                    line_img, sprite_err = self._build_sprite_text_line_image(
-                                        text,
-                                        legacy_path,
-                                        legacy_order,
-                                        legacy_cols,
-                                        bg_color_raw
-                                    )
-                                    if line_img is None:
-                                        raise Exception(sprite_err or "Sprite render failed")
-                                    direction = "right" if anim == 2 else "left"
-                                    self._start_sprite_scroll(line_img, bg_color_raw, preset.get('speed', 50), direction=direction)
-                                    return
-                                sprite_img, sprite_err = self._build_sprite_text_image(
-                                    text,
-                                    legacy_path,
-                                    legacy_order,
-                                    legacy_cols,
-                                    bg_color_raw
-                                )
-                            if sprite_img is None:
-                                raise Exception(sprite_err or "Sprite render failed")
-
-                            if preset.get('animation', 0) == 0:
-                                parts = [p.strip() for p in text.replace('|', '\n').splitlines() if p.strip()]
-                                if len(parts) > 1:
-                                    delay_ms = max(1, int(preset.get('text_static_delay_seconds', 2) or 2)) * 1000
-                                    state = {'idx': 0}
-
-                                    def tick():
-                                        send_value = parts[state['idx']]
-                                        sprite_img2, sprite_err2 = self._build_sprite_text_image(
-                                            send_value,
-                                            (font.get('path', '') if font else legacy_path),
-                                            (font.get('order', '') if font else legacy_order),
-                                            (font.get('cols', 1) if font else legacy_cols),
-                                            bg_color_raw
-                                        )
-                                        if sprite_img2 is None:
-                                            raise Exception(sprite_err2 or "Sprite render failed")
-                                        tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_text_sprite.png')
-                                        sprite_img2.save(tmp_path, 'PNG')
-                                        result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                                        if asyncio.iscoroutine(result):
-                                            self.run_async(result)
-                                        state['idx'] = (state['idx'] + 1) % len(parts)
-                                        self.text_static_timer = self.root.after(delay_ms, tick)
-
-                                    tick()
-                                    return
-
-                            tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_text_sprite.png')
-                            sprite_img.save(tmp_path, 'PNG')
-                            result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                            if asyncio.iscoroutine(result):
-                                self.run_async(result)
-                            return
-
-                        text_color = text_color_raw.lstrip('#')
-                        bg_color = bg_color_raw.lstrip('#')
-
-                        if preset.get('animation', 0) == 0:
-                            parts = [p.strip() for p in text.replace('|', '\n').splitlines() if p.strip()]
-                            if len(parts) > 1:
-                                delay_ms = max(1, int(preset.get('text_static_delay_seconds', 2) or 2)) * 1000
-                                state = {'idx': 0}
-
-                                def tick():
-                                    value_text = parts[state['idx']]
-                                    result = self.client.send_text(
-                                        value_text,
-                                        char_height=preset.get('char_height', 16),
-                                        color=text_color,
-                                        bg_color=bg_color,
-                                        animation=0,
-                                        speed=101 - preset.get('speed', 50),
-                                        rainbow_mode=preset.get('rainbow', 0)
-                                    )
-                                    if asyncio.iscoroutine(result):
-                                        self.run_async(result)
-                                    state['idx'] = (state['idx'] + 1) % len(parts)
-                                    self.text_static_timer = self.root.after(delay_ms, tick)
-
-                                tick()
-                                return
-
-                        # Invert speed: 1=slowest (100), 100=fastest (1)
-                        saved_speed = preset.get('speed', 50)
-                        inverted_speed = 101 - saved_speed
-
-                        result = self.client.send_text(
-                            text,
-                            char_height=preset.get('char_height', 16),
-                            color=text_color,
-                            bg_color=bg_color,
-                            animation=preset.get('animation', 0),
-                            speed=inverted_speed,
-                            rainbow_mode=preset.get('rainbow', 0)
-                        )
-
-                        if asyncio.iscoroutine(result):
-                            self.run_async(result)
-                    except Exception as e:
-                        error_msg = str(e)
-                        self.root.after(0, lambda: messagebox.showerror("Error", f"Failed: {error_msg}"))
-                
-                threading.Thread(target=send_task, daemon=True).start()
+                # Send text with saved settings; timers are armed here and writes are queued
+                self._send_text_preset(preset)
                 
             elif preset_type == "image":
                 image_path = self._resolve_asset_path(preset.get('image_path'))
-                if image_path and os.path.exists(image_path):
+                if self._asset_exists(image_path):
                     def send_task():
                         try:
                             result = self.client.send_image(image_path, resize_method='crop', save_slot=0)
@@ -5002,7 +5957,7 @@ class iPixelController:
                                 self.run_async(result)
                         except Exception as e:
                             error_msg = str(e)
-                            self.root.after(0, lambda: messagebox.showerror("Error", f"Failed: {error_msg}"))
+                            self._ui(messagebox.showerror, "Error", f"Failed: {error_msg}")
                     
                     threading.Thread(target=send_task, daemon=True).start()
                 else:
@@ -5013,21 +5968,21 @@ class iPixelController:
                 
                 if clock_mode == "builtin":
                     # Built-in hardware clock
+                    clock_style = preset.get('clock_style', 0)
+                    
                     def send_task():
                         try:
-                            result = self.client.set_clock_mode(style=preset.get('clock_style', 0))
+                            result = self.client.set_clock_mode(style=clock_style)
                             if asyncio.iscoroutine(result):
                                 self.run_async(result)
                         except Exception as e:
                             error_msg = str(e)
-                            self.root.after(0, lambda: messagebox.showerror("Error", f"Failed: {error_msg}"))
+                            self._ui(messagebox.showerror, "Error", f"Failed: {error_msg}")
                     
                     threading.Thread(target=send_task, daemon=True).start()
                     
                 elif clock_mode == "custom":
                     # Custom live clock - start it
-                    import time
-                    
                     time_format = preset.get('time_format', '%H:%M:%S')
                     clock_color = preset.get('clock_color', '#00ffff')
                     clock_bg_color = preset.get('clock_bg_color', '#000000')
@@ -5035,18 +5990,26 @@ class iPixelController:
                     update_interval = preset.get('clock_update_interval', 1)
                     clock_use_time_sprite = preset.get('clock_use_time_sprite', False)
                     clock_time_sprite_font_name = preset.get('clock_time_sprite_font_name', '').strip()
+                    # Legacy per-preset sprite sheet, read once rather than on every tick
+                    legacy_path = preset.get('clock_time_sprite_path', '').strip()
+                    legacy_order = preset.get('clock_time_sprite_order', '0123456789:')
+                    legacy_cols = preset.get('clock_time_sprite_cols', 11)
 
                     # Sync UI/state for sprite rendering colors
                     self.clock_color = clock_color
                     self.clock_bg_color = clock_bg_color
                     self.clock_color_canvas.config(bg=self.clock_color)
                     self.clock_bg_color_canvas.config(bg=self.clock_bg_color)
+                    if clock_use_time_sprite:
+                        # Select the preset's sprite font once, here on the Tk thread
+                        self.clock_sprite_font_var.set(clock_time_sprite_font_name)
                     
                     # Stop any existing clock
                     if hasattr(self, 'clock_running') and self.clock_running:
                         self.stop_live_clock()
                     
-                    self.clock_running = True
+                    run = self._begin_clock_run()
+                    deadline = [time.monotonic()]  # When the current tick was due
                     
                     def update_time():
                         if not self.clock_running:
@@ -5055,35 +6018,22 @@ class iPixelController:
                         try:
                             current_time = time.strftime(time_format)
                             
-                            anim_map = {
-                                "static": 0,
-                                "scroll_left": 1,
-                                "flash": 4
-                            }
                             
                             def send_task():
                                 try:
-                                    self.root.after(0, lambda t=current_time: self.clock_image_status_var.set(f"Clock tick: {t}"))
+                                    self._ui(self.clock_image_status_var.set, f"Clock tick: {current_time}")
 
                                     if clock_use_time_sprite:
-                                        self.clock_sprite_font_var.set(clock_time_sprite_font_name)
                                         sprite_img, sprite_err = self._build_time_sprite_image(current_time)
                                         if sprite_img is not None:
-                                            tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_clock_sprite.png')
-                                            sprite_img.save(tmp_path, 'PNG')
-                                            self.root.after(0, lambda p=tmp_path: self.clock_image_status_var.set(f"Sprite image: {os.path.basename(p)}"))
+                                            self._ui(self.clock_image_status_var.set, "Sprite image: ipixel_clock_sprite.png")
                                             try:
-                                                result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                                                if asyncio.iscoroutine(result):
-                                                    self.run_async(result)
+                                                self._send_pil_image(sprite_img, 'ipixel_clock_sprite.png')
                                                 return
                                             except Exception as e:
-                                                self.root.after(0, lambda: self.clock_image_status_var.set(f"Sprite send failed: {e}"))
+                                                self._ui(self.clock_image_status_var.set, f"Sprite send failed: {e}")
                                         else:
                                             # Legacy fallback
-                                            legacy_path = preset.get('clock_time_sprite_path', '').strip()
-                                            legacy_order = preset.get('clock_time_sprite_order', '0123456789:')
-                                            legacy_cols = preset.get('clock_time_sprite_cols', 11)
                                             if legacy_path:
                                                 sprite_img, sprite_err = self._build_sprite_text_image(
                                                     current_time,
@@ -5093,19 +6043,15 @@ class iPixelController:
                                                     clock_bg_color
                                                 )
                                                 if sprite_img is not None:
-                                                    tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_clock_sprite.png')
-                                                    sprite_img.save(tmp_path, 'PNG')
-                                                    self.root.after(0, lambda p=tmp_path: self.clock_image_status_var.set(f"Sprite image: {os.path.basename(p)}"))
+                                                    self._ui(self.clock_image_status_var.set, "Sprite image: ipixel_clock_sprite.png")
                                                     try:
-                                                        result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                                                        if asyncio.iscoroutine(result):
-                                                            self.run_async(result)
+                                                        self._send_pil_image(sprite_img, 'ipixel_clock_sprite.png')
                                                         return
                                                     except Exception as e:
-                                                        self.root.after(0, lambda: self.clock_image_status_var.set(f"Sprite send failed: {e}"))
-                                            self.root.after(0, lambda: self.clock_image_status_var.set(f"Sprite error: {sprite_err} (fallback to text)"))
+                                                        self._ui(self.clock_image_status_var.set, f"Sprite send failed: {e}")
+                                            self._ui(self.clock_image_status_var.set, f"Sprite error: {sprite_err} (fallback to text)")
                                     else:
-                                        self.root.after(0, lambda: self.clock_image_status_var.set("Sprite sheet disabled"))
+                                        self._ui(self.clock_image_status_var.set, "Sprite sheet disabled")
 
                                     color_hex = clock_color.lstrip('#')
                                     bg_color_hex = clock_bg_color.lstrip('#')
@@ -5115,7 +6061,7 @@ class iPixelController:
                                         char_height=16,
                                         color=color_hex,
                                         bg_color=bg_color_hex,
-                                        animation=anim_map.get(clock_animation, 0),
+                                        animation=self._ANIMATION_CODES.get(clock_animation, 0),
                                         speed=50
                                     )
 
@@ -5123,14 +6069,17 @@ class iPixelController:
                                         self.run_async(result)
                                 except Exception as e:
                                     error_msg = str(e)
-                                    self.root.after(0, lambda: messagebox.showerror("Error", f"Clock update failed: {error_msg}"))
+                                    self._ui(messagebox.showerror, "Error", f"Clock update failed: {error_msg}")
                                     self.clock_running = False
                             
-                            threading.Thread(target=send_task, daemon=True).start()
+                            # Skip this tick if the previous one has not reached the panel yet
+                            if not self._clock_send_inflight.is_set():
+                                self._clock_send_inflight.set()
+                                self._enqueue_ble(self._clock_job(send_task, run))
                             
                             if self.clock_running:
-                                interval = update_interval * 1000
-                                self.clock_timer = self.root.after(interval, update_time)
+                                delay = self._advance_clock_deadline(deadline, update_interval)
+                                self.clock_timer = self.root.after(delay, update_time)
                         
                         except Exception as e:
                             messagebox.showerror("Error", f"Clock error: {str(e)}")
@@ -5153,22 +6102,36 @@ class iPixelController:
                     countdown_bg_color = preset.get('countdown_bg_color', '#000000')
                     countdown_animation = preset.get('countdown_animation', 'static')
                     countdown_speed = preset.get('countdown_speed', 50)
+                    # Device-form colors and speed, computed once for every tick
+                    countdown_color_hex = countdown_color.lstrip('#')
+                    countdown_bg_color_hex = countdown_bg_color.lstrip('#')
+                    countdown_inverted_speed = 101 - countdown_speed
                     update_interval = preset.get('countdown_update_interval', 60)
                     countdown_use_sprite_font = preset.get('countdown_use_sprite_font', False)
                     countdown_sprite_font_name = preset.get('countdown_sprite_font_name', '').strip()
                     countdown_static_delay_seconds = preset.get('countdown_static_delay_seconds', 2)
+                    # Legacy per-preset sprite sheet, read once rather than on every tick
+                    legacy_path = preset.get('countdown_sprite_path', '').strip()
+                    legacy_order = preset.get('countdown_sprite_order', '')
+                    legacy_cols = preset.get('countdown_sprite_cols', 1)
+                    legacy_sprite_font = {'path': legacy_path, 'order': legacy_order, 'cols': legacy_cols}
+                    # Resolved once for the run; every update and frame tick reuses it
+                    countdown_sprite_font = (
+                        self._get_sprite_font_by_name(countdown_sprite_font_name) if countdown_use_sprite_font else None
+                    )
                     
                     # Stop any existing clock
                     if hasattr(self, 'clock_running') and self.clock_running:
                         self.stop_live_clock()
                     
-                    self.clock_running = True
+                    run = self._begin_clock_run()
                     
                     try:
                         target_datetime = datetime(target_year, target_month, target_day, target_hour, target_minute)
                     except ValueError:
                         messagebox.showerror("Invalid Date", "The countdown preset has an invalid date")
                         return
+                    deadline = [time.monotonic()]  # When the current tick was due
                     
                     def update_countdown():
                         if not self.clock_running:
@@ -5189,19 +6152,10 @@ class iPixelController:
                                 hours, remainder = divmod(delta.seconds, 3600)
                                 minutes, seconds = divmod(remainder, 60)
                                 
-                                if format_choice == "days_hours_mins":
-                                    countdown_text = f"{days}d {hours}h {minutes}m"
-                                elif format_choice == "days_hours":
-                                    countdown_text = f"{days}d {hours}h"
-                                elif format_choice == "hours_mins":
-                                    total_hours = days * 24 + hours
-                                    countdown_text = f"{total_hours}h {minutes}m"
-                                elif format_choice == "days_only":
-                                    countdown_text = f"{days} days"
-                                elif format_choice == "with_name":
-                                    countdown_text = f"{event_name}: {days}d {hours}h {minutes}m"
-                                else:
-                                    countdown_text = f"{days}d {hours}h {minutes}m"
+                                formatter = self._COUNTDOWN_FORMATTERS.get(
+                                    format_choice, self._COUNTDOWN_FORMATTERS["days_hours_mins"]
+                                )
+                                countdown_text = formatter(days, hours, minutes, event_name)
 
                             def _build_countdown_frames():
                                 if now >= target_datetime:
@@ -5226,16 +6180,11 @@ class iPixelController:
                                     return [f"{days} days"]
                                 return [f"{days}d", f"{hours}h {minutes}m"]
                             
-                            anim_map = {
-                                "static": 0,
-                                "scroll_left": 1,
-                                "flash": 4
-                            }
                             
                             def send_task():
                                 try:
                                     if countdown_use_sprite_font:
-                                        font = self._get_sprite_font_by_name(countdown_sprite_font_name)
+                                        font = countdown_sprite_font
                                         if font:
                                             if countdown_animation == "scroll_left":
                                                 line_img, sprite_err = self._build_sprite_text_line_image(
@@ -5251,58 +6200,14 @@ class iPixelController:
                                                 return
                                             if countdown_animation == "static":
                                                 delay_ms = max(1, int(countdown_static_delay_seconds or 2)) * 1000
-                                                frames = _build_countdown_frames()
-                                                if len(frames) > 1:
-                                                    state = {'index': 0}
-
-                                                    def tick():
-                                                        value_text = frames[state['index']]
-                                                        sprite_img2, sprite_err2 = self._build_sprite_text_image(
-                                                            value_text,
-                                                            font.get('path', ''),
-                                                            font.get('order', ''),
-                                                            font.get('cols', 1),
-                                                            countdown_bg_color
-                                                        )
-                                                        if sprite_img2 is None:
-                                                            raise Exception(sprite_err2 or "Sprite render failed")
-                                                        tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_countdown_sprite.png')
-                                                        sprite_img2.save(tmp_path, 'PNG')
-                                                        result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                                                        if asyncio.iscoroutine(result):
-                                                            self.run_async(result)
-                                                        state['index'] = (state['index'] + 1) % len(frames)
-                                                        self.countdown_static_timer = self.root.after(delay_ms, tick)
-
-                                                    tick()
-                                                else:
-                                                    value_text = frames[0]
-                                                    sprite_img2, sprite_err2 = self._build_sprite_text_image(
-                                                        value_text,
-                                                        font.get('path', ''),
-                                                        font.get('order', ''),
-                                                        font.get('cols', 1),
-                                                        countdown_bg_color
-                                                    )
-                                                    if sprite_img2 is None:
-                                                        raise Exception(sprite_err2 or "Sprite render failed")
-                                                    tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_countdown_sprite.png')
-                                                    sprite_img2.save(tmp_path, 'PNG')
-                                                    result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                                                    if asyncio.iscoroutine(result):
-                                                        self.run_async(result)
+                                                self._cycle_countdown_sprite_frames(
+                                                    _build_countdown_frames(), font, countdown_bg_color, delay_ms, run
+                                                )
                                                 return
-                                            sprite_img, sprite_err = self._build_sprite_text_image(
-                                                countdown_text,
-                                                font.get('path', ''),
-                                                font.get('order', ''),
-                                                font.get('cols', 1),
-                                                countdown_bg_color
+                                            sprite_png, sprite_err = self._get_countdown_sprite_png(
+                                                countdown_text, font, countdown_bg_color
                                             )
                                         else:
-                                            legacy_path = preset.get('countdown_sprite_path', '').strip()
-                                            legacy_order = preset.get('countdown_sprite_order', '')
-                                            legacy_cols = preset.get('countdown_sprite_cols', 1)
                                             if not legacy_path:
                                                 raise Exception("Sprite font not found")
                                             if countdown_animation == "scroll_left":
@@ -5319,61 +6224,16 @@ class iPixelController:
                                                 return
                                             if countdown_animation == "static":
                                                 delay_ms = max(1, int(countdown_static_delay_seconds or 2)) * 1000
-                                                frames = _build_countdown_frames()
-                                                if len(frames) > 1:
-                                                    state = {'index': 0}
-
-                                                    def tick():
-                                                        value_text = frames[state['index']]
-                                                        sprite_img2, sprite_err2 = self._build_sprite_text_image(
-                                                            value_text,
-                                                            legacy_path,
-                                                            legacy_order,
-                                                            legacy_cols,
-                                                            countdown_bg_color
-                                                        )
-                                                        if sprite_img2 is None:
-                                                            raise Exception(sprite_err2 or "Sprite render failed")
-                                                        tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_countdown_sprite.png')
-                                                        sprite_img2.save(tmp_path, 'PNG')
-                                                        result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                                                        if asyncio.iscoroutine(result):
-                                                            self.run_async(result)
-                                                        state['index'] = (state['index'] + 1) % len(frames)
-                                                        self.countdown_static_timer = self.root.after(delay_ms, tick)
-
-                                                    tick()
-                                                else:
-                                                    value_text = frames[0]
-                                                    sprite_img2, sprite_err2 = self._build_sprite_text_image(
-                                                        value_text,
-                                                        legacy_path,
-                                                        legacy_order,
-                                                        legacy_cols,
-                                                        countdown_bg_color
-                                                    )
-                                                    if sprite_img2 is None:
-                                                        raise Exception(sprite_err2 or "Sprite render failed")
-                                                    tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_countdown_sprite.png')
-                                                    sprite_img2.save(tmp_path, 'PNG')
-                                                    result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                                                    if asyncio.iscoroutine(result):
-                                                        self.run_async(result)
+                                                self._cycle_countdown_sprite_frames(
+                                                    _build_countdown_frames(), legacy_sprite_font, countdown_bg_color, delay_ms, run
+                                                )
                                                 return
-                                            sprite_img, sprite_err = self._build_sprite_text_image(
-                                                countdown_text,
-                                                legacy_path,
-                                                legacy_order,
-                                                legacy_cols,
-                                                countdown_bg_color
+                                            sprite_png, sprite_err = self._get_countdown_sprite_png(
+                                                countdown_text, legacy_sprite_font, countdown_bg_color
                                             )
-                                        if sprite_img is None:
+                                        if sprite_png is None:
                                             raise Exception(sprite_err or "Sprite render failed")
-                                        tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_countdown_sprite.png')
-                                        sprite_img.save(tmp_path, 'PNG')
-                                        result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                                        if asyncio.iscoroutine(result):
-                                            self.run_async(result)
+                                        self._send_png_bytes(sprite_png, 'ipixel_countdown_sprite.png')
                                     else:
                                         if countdown_animation == "static":
                                             delay_ms = max(1, int(countdown_static_delay_seconds or 2)) * 1000
@@ -5383,16 +6243,13 @@ class iPixelController:
 
                                                 def tick():
                                                     value_text = frames[state['index']]
-                                                    color_hex = countdown_color.lstrip('#')
-                                                    bg_color_hex = countdown_bg_color.lstrip('#')
-                                                    inverted_speed = 101 - countdown_speed
                                                     result = self.client.send_text(
                                                         text=value_text,
                                                         char_height=16,
-                                                        color=color_hex,
-                                                        bg_color=bg_color_hex,
+                                                        color=countdown_color_hex,
+                                                        bg_color=countdown_bg_color_hex,
                                                         animation=0,
-                                                        speed=inverted_speed
+                                                        speed=countdown_inverted_speed
                                                     )
                                                     if asyncio.iscoroutine(result):
                                                         self.run_async(result)
@@ -5401,48 +6258,42 @@ class iPixelController:
 
                                                 tick()
                                             else:
-                                                color_hex = countdown_color.lstrip('#')
-                                                bg_color_hex = countdown_bg_color.lstrip('#')
-                                                inverted_speed = 101 - countdown_speed
                                                 result = self.client.send_text(
                                                     text=frames[0],
                                                     char_height=16,
-                                                    color=color_hex,
-                                                    bg_color=bg_color_hex,
+                                                    color=countdown_color_hex,
+                                                    bg_color=countdown_bg_color_hex,
                                                     animation=0,
-                                                    speed=inverted_speed
+                                                    speed=countdown_inverted_speed
                                                 )
                                                 if asyncio.iscoroutine(result):
                                                     self.run_async(result)
                                             return
 
-                                        color_hex = countdown_color.lstrip('#')
-                                        bg_color_hex = countdown_bg_color.lstrip('#')
-
-                                        # Invert speed: 1=slowest (100), 100=fastest (1)
-                                        inverted_speed = 101 - countdown_speed
-
                                         result = self.client.send_text(
                                             text=countdown_text,
                                             char_height=16,
-                                            color=color_hex,
-                                            bg_color=bg_color_hex,
-                                            animation=anim_map.get(countdown_animation, 0),
-                                            speed=inverted_speed
+                                            color=countdown_color_hex,
+                                            bg_color=countdown_bg_color_hex,
+                                            animation=self._ANIMATION_CODES.get(countdown_animation, 0),
+                                            speed=countdown_inverted_speed
                                         )
 
                                         if asyncio.iscoroutine(result):
                                             self.run_async(result)
                                 except Exception as e:
                                     error_msg = str(e)
-                                    self.root.after(0, lambda: messagebox.showerror("Error", f"Countdown update failed: {error_msg}"))
+                                    self._ui(messagebox.showerror, "Error", f"Countdown update failed: {error_msg}")
                                     self.clock_running = False
                             
-                            threading.Thread(target=send_task, daemon=True).start()
+                            # Skip this tick if the previous one has not reached the panel yet
+                            if not self._clock_send_inflight.is_set():
+                                self._clock_send_inflight.set()
+                                self._enqueue_ble(self._clock_job(send_task, run))
                             
                             if self.clock_running:
-                                interval = update_interval * 1000
-                                self.clock_timer = self.root.after(interval, update_countdown)
+                                delay = self._advance_clock_deadline(deadline, update_interval)
+                                self.clock_timer = self.root.after(delay, update_countdown)
                         
                         except Exception as e:
                             messagebox.showerror("Error", f"Countdown error: {str(e)}")
@@ -5472,8 +6323,8 @@ class iPixelController:
                         previous_close = info.get('previousClose') or info.get('regularMarketPreviousClose')
                         
                         if current_price is None:
-                            self.root.after(0, lambda: messagebox.showerror(
-                                "Stock Error", f"Could not fetch data for {ticker}"))
+                            self._ui(messagebox.showerror,
+                                "Stock Error", f"Could not fetch data for {ticker}")
                             return
                         
                         change = current_price - previous_close if previous_close else 0
@@ -5545,14 +6396,10 @@ class iPixelController:
 
                                     if sprite_img is None:
                                         raise Exception(sprite_err or "Sprite render failed")
-                                    tmp_path = os.path.join(tempfile.gettempdir(), 'ipixel_stock_sprite.png')
-                                    sprite_img.save(tmp_path, 'PNG')
-                                    result = self.client.send_image(tmp_path, resize_method='crop', save_slot=0)
-                                    if asyncio.iscoroutine(result):
-                                        self.run_async(result)
+                                    self._send_pil_image(sprite_img, 'ipixel_stock_sprite.png')
                                 except Exception as e:
                                     error_msg = str(e)
-                                    self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to send: {error_msg}"))
+                                    self._ui(messagebox.showerror, "Error", f"Failed to send: {error_msg}")
 
                             threading.Thread(target=send_task, daemon=True).start()
 
@@ -5591,12 +6438,12 @@ class iPixelController:
                             self.stock_refresh_timer = self.root.after(interval_ms, fetch_and_send)
                         
                     except ImportError:
-                        self.root.after(0, lambda: messagebox.showerror(
+                        self._ui(messagebox.showerror,
                             "Missing Library", 
-                            "yfinance library not installed.\n\nInstall with: pip install yfinance"))
+                            "yfinance library not installed.\n\nInstall with: pip install yfinance")
                     except Exception as e:
                         error_msg = str(e)
-                        self.root.after(0, lambda: messagebox.showerror("Stock Error", f"Error: {error_msg}"))
+                        self._ui(messagebox.showerror, "Stock Error", f"Error: {error_msg}")
                 
                 threading.Thread(target=fetch_and_send, daemon=True).start()
             
@@ -5652,7 +6499,7 @@ class iPixelController:
         """Delete a preset"""
         if messagebox.askyesno("Delete Preset", f"Delete preset '{self.presets[index]['name']}'?"):
             del self.presets[index]
-            self.save_presets()
+            self._schedule_save_presets()
             self.refresh_preset_buttons()
     
     def import_presets(self):
@@ -5668,13 +6515,27 @@ class iPixelController:
                     imported = json.load(f)
                     if isinstance(imported, list):
                         self.presets.extend(imported)
-                        self.save_presets()
+                        self._schedule_save_presets()
                         self.refresh_preset_buttons()
                     else:
                         messagebox.showerror("Error", "Invalid preset file format")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to import: {str(e)}")
     
+    def _portable_preset(self, preset):
+        """Copy of a preset for export, with its local thumbnail file inlined as base64"""
+        thumbnail_path = preset.get('thumbnail_path')
+        if not thumbnail_path:
+            return preset
+        exported = dict(preset)
+        del exported['thumbnail_path']
+        try:
+            with open(thumbnail_path, 'rb') as f:
+                exported['thumbnail'] = base64.b64encode(f.read()).decode('ascii')
+        except OSError:
+            pass
+        return exported
+    
     def export_presets(self):
         """Export presets to a JSON file"""
         if not self.presets:
@@ -5690,7 +6551,7 @@ class iPixelController:
         if filepath:
             try:
                 with open(filepath, 'w') as f:
-                    json.dump(self.presets, f, indent=2)
+                    json.dump([self._portable_preset(p) for p in self.presets], f, indent=2)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export: {str(e)}")
     
@@ -5878,10 +6739,10 @@ class iPixelController:
         use_anim_duration = item.get('use_anim_duration', False)
         
         # Find and execute the preset
-        preset = next((p for p in self.presets if p['name'] == preset_name), None)
+        preset = self._preset_by_name.get(preset_name)
         if preset:
             self.playlist_status_var.set(f"Playlist: Playing '{preset_name}' ({self.playlist_index + 1}/{len(self.playlist)})")
-            threading.Thread(target=self.execute_preset, args=(preset,), daemon=True).start()
+            self.execute_preset(preset)
 
             # Schedule next preset
             delay_seconds = duration